@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Measure the import time of shadcn_nicegui in fresh interpreters.
+
+Usage:
+    python benchmark_import.py [--runs 10] [--baseline <git ref>]
+
+With --baseline, the package is also checked out at the given git ref (e.g. a release tag)
+into a temporary directory and measured side by side with the working tree.
+"""
+import argparse
+import io
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+from pathlib import Path
+
+SCENARIOS = {
+    'import shadcn_nicegui': 'import shadcn_nicegui',
+    'from shadcn_nicegui import button': 'from shadcn_nicegui import button',
+    'first chart use (button + barchart)': 'from shadcn_nicegui import button, barchart; import plotly.graph_objects',
+}
+
+
+def measure(statement: str, runs: int, cwd: Path) -> float:
+    """Return the median wall time in milliseconds of running the statement in a fresh interpreter"""
+    code = f'import time; t = time.perf_counter(); {statement}; print(time.perf_counter() - t)'
+    times = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                                cwd=cwd).stdout
+        times.append(float(output.strip().splitlines()[-1]) * 1000)
+    return statistics.median(times)
+
+
+def checkout(ref: str, directory: Path):
+    """Extract the package as of the given git ref into the directory"""
+    archive = subprocess.run(['git', 'archive', ref, 'shadcn_nicegui'], capture_output=True, check=True,
+                             cwd=Path(__file__).parent).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(directory)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10, help='number of fresh interpreters per scenario')
+    parser.add_argument('--baseline', help='git ref to compare the working tree against')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as baseline_directory:
+        trees = {'current': Path(__file__).parent}
+        if args.baseline:
+            checkout(args.baseline, Path(baseline_directory))
+            trees = {args.baseline: Path(baseline_directory), **trees}
+
+        width = max(len(name) for name in SCENARIOS)
+        print(f'{"":<{width}}' + ''.join(f'  {tree:>12}' for tree in trees))
+        for name, statement in SCENARIOS.items():
+            print(f'{name:<{width}}' + ''.join(f'  {measure(statement, args.runs, cwd):9.1f} ms' for cwd in trees.values()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,57 @@
 """Shadcn-style UI components for NiceGUI."""
+import importlib
+from typing import TYPE_CHECKING
 
 __version__ = "0.2.13"
 
-from .components import (
-    button,
-    input,
-    select,
-    heading,
-    card,
-    expandable,
-    accordion,
-    table,
-    dialog,
-    badge,
-    avatar,
-    separator,
-    calendar,
-    barchart,
-    timeseries,
-    set_global_font,
-    set_theme,
-)
+if TYPE_CHECKING:
+    from .components import (
+        button,
+        input,
+        select,
+        heading,
+        card,
+        expandable,
+        accordion,
+        table,
+        dialog,
+        badge,
+        avatar,
+        separator,
+        calendar,
+        barchart,
+        timeseries,
+        histogram,
+        heatmap,
+        sparkline,
+        Crossfilter,
+        cached_aggregate,
+        set_aggregate_cache,
+        virtual_accordion,
+        client_toggle,
+        confirm,
+        register_options,
+        form,
+        static,
+        cached_fragment,
+        badge_group,
+        button_group,
+        avatar_stack,
+        lazy_section,
+        table_async,
+        barchart_async,
+        timeseries_async,
+        KeyedList,
+        for_each,
+        Badge,
+        Heading,
+        Card,
+        register_live_source,
+        live_update,
+        set_avatar_cache,
+        set_global_font,
+        set_theme,
+    )
 
 __all__ = [
     "button",
@@ -38,6 +69,47 @@ __all__ = [
     "calendar",
     "barchart",
     "timeseries",
+    "histogram",
+    "heatmap",
+    "sparkline",
+    "Crossfilter",
+    "cached_aggregate",
+    "set_aggregate_cache",
+    "virtual_accordion",
+    "client_toggle",
+    "confirm",
+    "register_options",
+    "form",
+    "static",
+    "cached_fragment",
+    "badge_group",
+    "button_group",
+    "avatar_stack",
+    "lazy_section",
+    "table_async",
+    "barchart_async",
+    "timeseries_async",
+    "KeyedList",
+    "for_each",
+    "Badge",
+    "Heading",
+    "Card",
+    "register_live_source",
+    "live_update",
+    "set_avatar_cache",
     "set_global_font",
     "set_theme",
 ]
+
+
+def __getattr__(name: str):
+    """Import the components module on first access (PEP 562), keeping ``import shadcn_nicegui`` cheap."""
+    if name in __all__:
+        value = getattr(importlib.import_module('.components', __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
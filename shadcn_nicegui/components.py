@@ -1,7 +1,35 @@
 """Shadcn-style UI components for NiceGUI."""
-from nicegui import ui
-import plotly.graph_objects as go
-from typing import List, Dict, Optional
+import asyncio
+import copy
+import functools
+import hashlib
+import html
+import inspect
+import io
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import urllib.parse
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from types import SimpleNamespace
+from nicegui import Client, app, background_tasks, context, run, ui
+from nicegui.binding import BindableProperty, bind, bind_from, bind_to
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, List, Dict, Optional, Sequence, Tuple, Union
+
+# numpy and plotly are imported inside the functions using them, so importing a component stays cheap
+if TYPE_CHECKING:
+    import numpy as np
+
+log = logging.getLogger(__name__)
+
+# ui.html requires ``sanitize`` since NiceGUI 3 and does not accept it before
+_HTML_OPTIONS = {'sanitize': False} if 'sanitize' in inspect.signature(ui.html.__init__).parameters else {}
 
 
 # Theme Configuration
@@ -55,6 +83,7 @@ class Theme:
         'raw-border': '#e5e7eb',
         'raw-grid': '#f3f4f6',
         'raw-accent': '#0f172a',
+        'raw-avatar-palette': '#fecaca,#fed7aa,#fde68a,#bbf7d0,#a5f3fc,#bfdbfe,#c7d2fe,#f5d0fe',
     }
 
     DARK = {
@@ -104,6 +133,7 @@ class Theme:
         'raw-border': '#334155',
         'raw-grid': '#1e293b',
         'raw-accent': '#f8fafc',
+        'raw-avatar-palette': '#7f1d1d,#7c2d12,#713f12,#14532d,#164e63,#1e3a8a,#312e81,#701a75',
     }
 
 
@@ -184,18 +214,185 @@ def set_global_font(font_family: str):
     FontConfig.set_font(font_family)
 
 
-def button(text: str, on_click=None, variant='default', size='default', icon=None, font_family: Optional[str] = None, additional_classes: str = ''):
-    """Create a shadcn-style button
+# Aggregate cache configuration
+class AggregateCacheConfig:
+    """Global configuration of the on-disk chart aggregate cache."""
+    _directory: Optional[Path] = None
+
+    @classmethod
+    def set_directory(cls, directory: Optional[Union[str, Path]]):
+        """Set the cache directory (None disables the cache).
+
+        Args:
+            directory: Local directory for cached aggregates
+        """
+        cls._directory = Path(directory) if directory is not None else None
+
+    @classmethod
+    def get_directory(cls) -> Optional[Path]:
+        """Get the cache directory, or None if caching is disabled."""
+        return cls._directory
+
+
+# Avatar thumbnail cache configuration
+class AvatarCacheConfig:
+    """Global configuration of the on-disk avatar thumbnail cache."""
+    _directory: Optional[Path] = None
+
+    @classmethod
+    def set_directory(cls, directory: Union[str, Path]):
+        """Set the cache directory.
+
+        Args:
+            directory: Local directory for cached thumbnails
+        """
+        cls._directory = Path(directory)
+
+    @classmethod
+    def get_directory(cls) -> Path:
+        """Get the cache directory (default: inside the NiceGUI storage directory of the app)."""
+        return cls._directory if cls._directory is not None else app.storage.path / 'shadcn' / 'avatars'
+
+
+def set_aggregate_cache(directory: Optional[Union[str, Path]]):
+    """Enable the persistent cache for chart aggregates.
 
     Args:
-        text: Button text
-        on_click: Click handler
-        variant: 'default', 'destructive', 'outline', 'ghost', 'secondary'
-        size: 'default', 'sm', 'lg', 'icon'
-        icon: Optional icon name
-        font_family: Optional custom font family (overrides global font)
-        additional_classes: Additional Tailwind classes
+        directory: Local directory to store cached aggregates in (None disables the cache)
+
+    Example:
+        set_aggregate_cache('.cache/shadcn')
+    """
+    AggregateCacheConfig.set_directory(directory)
+
+
+def set_avatar_cache(directory: Union[str, Path]):
+    """Set the directory of the on-disk cache for avatar thumbnails.
+
+    Thumbnails are stored in the NiceGUI storage directory of the app by default (``.nicegui``
+    or ``NICEGUI_STORAGE_PATH``). The directory should only be writable by the app.
+
+    Args:
+        directory: Local directory to store cached thumbnails in
+
+    Example:
+        set_avatar_cache('.cache/shadcn/avatars')
+    """
+    AvatarCacheConfig.set_directory(directory)
+
+
+def _fingerprint(source) -> list:
+    """Return a cheap, stable fingerprint of a file path or an array-like data source."""
+    import numpy as np
+    if isinstance(source, (str, Path)) and os.path.isfile(source):
+        stat = os.stat(source)
+        return ['file', os.path.abspath(source), stat.st_size, stat.st_mtime_ns]
+    array = np.asarray(source)
+    if array.dtype == object:
+        return ['object', hashlib.sha256(repr(array.tolist()).encode()).hexdigest()]
+    return ['array', array.dtype.str, list(array.shape), hashlib.sha256(np.ascontiguousarray(array).tobytes()).hexdigest()]
+
+
+def _code_fingerprint(function: Callable) -> str:
+    """Return a hash of a function's bytecode, constants, referenced names, defaults and closure values."""
+    digest = hashlib.sha256(f'{function.__module__}.{function.__qualname__}'.encode())
+
+    def add_code(code):
+        digest.update(code.co_code)
+        digest.update(repr(code.co_names).encode())
+        for const in code.co_consts:
+            if inspect.iscode(const):
+                add_code(const)  # nested functions, lambdas and comprehensions
+            else:
+                digest.update(repr(const).encode())
+
+    code = getattr(function, '__code__', None)
+    if code is None:
+        return digest.hexdigest()
+    add_code(code)
+    digest.update(repr((function.__defaults__, function.__kwdefaults__)).encode())
+    for cell in function.__closure__ or ():
+        try:
+            value = cell.cell_contents
+        except ValueError:  # cell not filled yet
+            continue
+        if inspect.isfunction(value):
+            digest.update(_code_fingerprint(value).encode())
+            continue
+        try:
+            digest.update(json.dumps(_fingerprint(value), default=str).encode())
+        except (TypeError, ValueError):  # not convertible to an array, e.g. ragged lists
+            digest.update(repr(value).encode())
+    return digest.hexdigest()
+
+
+def cached_aggregate(compute: Callable[..., Dict[str, Sequence]], sources: Sequence = (), **params) -> Dict[str, 'np.ndarray']:
+    """Compute chart inputs once and reuse them from disk on later runs.
+
+    The result is keyed by a fingerprint of the ``compute`` function (its bytecode,
+    constants, referenced names, defaults and closure values), a fingerprint of the
+    ``sources`` (file size and modification time, or a hash of in-memory arrays) and
+    ``params``. Changes in other functions called by ``compute`` are not detected;
+    pass a version in ``params`` to invalidate the cache in that case. Cached arrays
+    are stored as ``.npy`` files and opened memory-mapped, so a cold start only reads
+    what the chart actually uses. Arrays of Python objects cannot be memory-mapped and
+    are stored as strings, so ``['a', 1]`` is returned as ``['a', '1']``. Without a
+    cache directory (see ``set_aggregate_cache``) the function simply calls ``compute``.
+
+    Args:
+        compute: Function returning a dictionary of arrays, called with ``**params``
+        sources: Files or arrays the aggregate is derived from
+        **params: Aggregation parameters (must be JSON serializable)
+
+    Returns:
+        Dictionary of NumPy arrays (memory-mapped when loaded from the cache)
+
+    Example:
+        def monthly_sales(path, year):
+            ...
+            return {'months': months, 'totals': totals}
+
+        agg = cached_aggregate(monthly_sales, ['sales.parquet'], path='sales.parquet', year=2024)
+        barchart(dict(zip(agg['months'], agg['totals'])), title='Sales')
     """
+    import numpy as np
+    directory = AggregateCacheConfig.get_directory()
+    if directory is None:
+        return {name: np.asarray(values) for name, values in compute(**params).items()}
+
+    key = json.dumps([
+        _code_fingerprint(compute),
+        [_fingerprint(source) for source in sources],
+        params,
+    ], sort_keys=True, default=str)
+    entry = directory / hashlib.sha256(key.encode()).hexdigest()
+    manifest = entry / 'manifest.json'
+
+    if not manifest.exists():
+        directory.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=directory, prefix='.tmp-'))
+        try:
+            names = []
+            for name, values in compute(**params).items():
+                array = np.asarray(values)
+                if array.dtype == object:
+                    array = array.astype(str)
+                np.save(staging / f'{len(names)}.npy', array, allow_pickle=False)
+                names.append(name)
+            (staging / 'manifest.json').write_text(json.dumps({'key': key, 'names': names}))
+            os.replace(staging, entry)  # atomic publish, a concurrent writer may have won the race
+        except OSError:
+            if not manifest.exists():
+                raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    names = json.loads(manifest.read_text())['names']
+    return {name: np.load(entry / f'{i}.npy', mmap_mode='r', allow_pickle=False) for i, name in enumerate(names)}
+
+
+def _button_classes(variant: str = 'default', size: str = 'default', additional_classes: str = '') -> str:
+    """Return the Tailwind classes of a shadcn-style button."""
     theme = ThemeConfig.get_theme()
 
     # Base classes for all buttons
@@ -218,7 +415,22 @@ def button(text: str, on_click=None, variant='default', size='default', icon=Non
         'icon': 'h-10 w-10',
     }
 
-    classes = f'{base_classes} {variant_classes.get(variant, variant_classes["default"])} {size_classes.get(size, size_classes["default"])} {additional_classes}'.strip()
+    return f'{base_classes} {variant_classes.get(variant, variant_classes["default"])} {size_classes.get(size, size_classes["default"])} {additional_classes}'.strip()
+
+
+def button(text: str, on_click=None, variant='default', size='default', icon=None, font_family: Optional[str] = None, additional_classes: str = ''):
+    """Create a shadcn-style button
+
+    Args:
+        text: Button text
+        on_click: Click handler
+        variant: 'default', 'destructive', 'outline', 'ghost', 'secondary'
+        size: 'default', 'sm', 'lg', 'icon'
+        icon: Optional icon name
+        font_family: Optional custom font family (overrides global font)
+        additional_classes: Additional Tailwind classes
+    """
+    classes = _button_classes(variant, size, additional_classes)
 
     btn = ui.button(text, on_click=on_click).classes(classes)
     btn.props('flat no-caps')
@@ -230,56 +442,620 @@ def button(text: str, on_click=None, variant='default', size='default', icon=Non
     return btn
 
 
-def input(label: str = '', placeholder: str = '', value: str = '', font_family: Optional[str] = None, additional_classes: str = ''):
+def _keep_value_in_browser(element: ui.element):
+    """Stop sending every value change to the server; the browser keeps the value in the element's props."""
+    prop = element.VALUE_PROP
+    for listener in element._event_listeners.values():
+        if listener.type.replace('-', '').lower() == f'update:{prop}'.replace('-', '').lower():
+            listener.js_handler = f'(value) => {{ mounted_app.elements[{element.id}].props["{prop}"] = value; }}'
+
+
+def _sync_value_on(element: ui.element, event: str):
+    """Send the value kept in the browser to the server only when the given event occurs."""
+    _keep_value_in_browser(element)
+
+    def sync(e):
+        element.set_value(element._event_args_to_value(SimpleNamespace(args=e.args)))
+
+    element.on(event, sync, js_handler=f'() => emit(mounted_app.elements[{element.id}].props["{element.VALUE_PROP}"])')
+
+
+def _validation_rules(element: ui.element, rules: Optional[Dict[str, str]] = None, required: bool = False):
+    """Validate the field in the browser with Quasar rules (error message -> JavaScript condition on ``val``)."""
+    checks = dict(rules or {})
+    if required:
+        checks = {'This field is required': "val !== null && val !== undefined && val !== '' && !(Array.isArray(val) && !val.length)", **checks}
+    if checks:
+        element._props[':rules'] = '[' + ', '.join(f'(val) => ({condition}) || {json.dumps(message)}' for message, condition in checks.items()) + ']'
+
+
+class _Form(ui.element):
+    """q-form whose fields keep their values in the browser until the form is submitted."""
+
+    def __init__(self, on_submit: Callable[[Dict], Optional[Awaitable]]):
+        super().__init__('q-form')
+        self.fields: Dict[str, ui.element] = {}
+        self._on_submit = on_submit
+        # QForm only emits "submit" once all rules of its fields pass
+        self.on('submit', self._handle_submit, js_handler=self._collect_values_js())
+
+    def _collect_values_js(self) -> str:
+        values = ', '.join(
+            f'{json.dumps(name)}: mounted_app.elements[{field.id}].props["{field.VALUE_PROP}"]'
+            for name, field in self.fields.items()
+        )
+        return f'() => emit({{{values}}})'
+
+    def add_field(self, name: str, field: ui.element):
+        if name in self.fields:
+            raise ValueError(f'The form already has a field named {name!r}, pass a unique name')
+        self.fields[name] = field
+        _keep_value_in_browser(field)
+        for listener in self._event_listeners.values():
+            if listener.type == 'submit':
+                listener.js_handler = self._collect_values_js()
+        self.update()
+
+    async def _handle_submit(self, e):
+        values = {}
+        for name, raw_value in (e.args or {}).items():
+            field = self.fields.get(name)
+            if field is None:
+                continue
+            field.set_value(field._event_args_to_value(SimpleNamespace(args=raw_value)))
+            values[name] = field.value
+        result = self._on_submit(values)
+        if inspect.isawaitable(result):
+            await result
+
+
+def _enclosing_form(slot) -> Optional[_Form]:
+    """Return the form containing the given slot, if any."""
+    while slot is not None and not isinstance(slot.parent, _Form):
+        slot = slot.parent.parent_slot
+    return slot.parent if slot is not None else None
+
+
+def _register_form_field(field: ui.element, name: Optional[str]):
+    """Add the field to the form it is created in, if any."""
+    form_element = _enclosing_form(field.parent_slot)
+    if form_element is not None:
+        form_element.add_field(name or f'field_{len(form_element.fields)}', field)
+
+
+def form(on_submit: Callable[[Dict], Optional[Awaitable]], additional_classes: str = ''):
+    """Create a shadcn-style form
+
+    Fields created inside the form (input, select, calendar) keep their values in the browser.
+    On submit, the browser validates the fields' rules and sends all values to the server in
+    a single message; invalid submissions never reach the server.
+
+    Args:
+        on_submit: (Async) callback receiving a dictionary mapping field names to values
+        additional_classes: Additional Tailwind classes
+
+    Returns:
+        ui.element object (use as a context manager)
+
+    Example:
+        with form(on_submit=lambda values: save_user(**values)):
+            input('Name', name='name', required=True)
+            input('Email', name='email', rules={'Invalid email': "val.includes('@')"})
+            select(['Admin', 'User'], label='Role', name='role')
+            button('Save').props('type=submit')
+    """
+    return _Form(on_submit).classes(f'w-full flex flex-col gap-4 {additional_classes}'.strip())
+
+
+def input(
+    label: str = '',
+    placeholder: str = '',
+    value: str = '',
+    debounce_ms: Optional[int] = None,
+    update_on: str = 'input',
+    name: Optional[str] = None,
+    rules: Optional[Dict[str, str]] = None,
+    required: bool = False,
+    compact: bool = False,
+    font_family: Optional[str] = None,
+    additional_classes: str = ''
+):
     """Create a shadcn-style input field
 
     Args:
         label: Input label
         placeholder: Placeholder text
         value: Initial value
+        debounce_ms: Optional delay after the last keystroke before the value is synced
+        update_on: When to send the value to the server: 'input' (every keystroke, default),
+                   'change' (on Enter or leaving a changed field) or 'blur' (on leaving the field)
+        name: Key of the value when used inside a form (default: the label)
+        rules: Optional validation rules checked in the browser, mapping error messages to
+               JavaScript conditions on ``val`` (e.g. {'Too short': 'val.length >= 3'})
+        required: Whether the field must not be empty
+        compact: Render a single element with the label inside the field instead of a
+                 column with a separate label (for forms with many fields)
         font_family: Optional custom font family (overrides global font)
         additional_classes: Additional Tailwind classes
     """
+    if update_on not in ('input', 'change', 'blur'):
+        raise ValueError(f"update_on must be 'input', 'change' or 'blur', not {update_on!r}")
+
     theme = ThemeConfig.get_theme()
     font = font_family or FontConfig.get_font()
 
-    with ui.column().classes('w-full gap-1'):
-        if label:
-            label_elem = ui.label(label).classes(f'text-sm font-medium {theme["text-primary"]}')
-            label_elem.style(f'font-family: {font}')
-        input_field = ui.input(placeholder=placeholder, value=value)
-        input_field.classes(f'w-full {theme["input-bg"]} {theme["text-primary"]} {additional_classes}'.strip())
-        input_field.props('outlined dense borderless')
-        input_field.style(f'font-family: {font}')
+    if compact:
+        # A single element: Quasar renders the label inside the field
+        input_field = ui.input(label=label or None, placeholder=placeholder, value=value).props('stack-label')
+    else:
+        with ui.column().classes('w-full gap-1'):
+            if label:
+                label_elem = ui.label(label).classes(f'text-sm font-medium {theme["text-primary"]}')
+                label_elem.style(f'font-family: {font}')
+            input_field = ui.input(placeholder=placeholder, value=value)
+    input_field.classes(f'w-full {theme["input-bg"]} {theme["text-primary"]} {additional_classes}'.strip())
+    input_field.props('outlined dense borderless')
+    input_field.style(f'font-family: {font}')
+
+    if debounce_ms:
+        input_field.props(f'debounce={debounce_ms}')
+    if update_on in ('change', 'blur'):
+        _sync_value_on(input_field, update_on)
+    _validation_rules(input_field, rules, required)
+    _register_form_field(input_field, name or label)
 
     return input_field
 
 
-def select(options: list, label: str = '', value=None, font_family: Optional[str] = None, additional_classes: str = ''):
+class _LRUCache:
+    """Small thread-safe least-recently-used cache whose entries optionally expire after a time-to-live."""
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._data: 'OrderedDict' = OrderedDict()
+        self._lock = threading.Lock()  # used from run.io_bound threads, e.g. by avatar thumbnails
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires, value = entry
+            if expires is not None and expires < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl: Optional[float] = None):
+        with self._lock:
+            self._data[key] = (None if ttl is None else time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+class _OptionSet:
+    """Immutable option list, serialized once and shared by every select referencing it."""
+
+    def __init__(self, name: str, options: Union[list, dict]):
+        self.name = name
+        self.options = list(options) if isinstance(options, (list, tuple)) else dict(options)
+        self.values = self.options if isinstance(self.options, list) else list(self.options.keys())
+        self.labels = self.options if isinstance(self.options, list) else list(self.options.values())
+        self.payload = json.dumps([{'value': i, 'label': label} for i, label in enumerate(self.labels)], default=str).encode()
+        self.etag = hashlib.sha256(self.payload).hexdigest()[:32]
+
+    @property
+    def url(self) -> str:
+        return f'/_shadcn/options/{self.name}.json?v={self.etag}'
+
+
+class _SharedOptionSelect(ui.select):
+    """ui.select whose options are fetched by the browser from a registered option set."""
+
+    def __init__(self, option_set: _OptionSet, value=None):
+        self._option_set = option_set
+        super().__init__(option_set.options, value=value)
+
+    def _update_values_and_labels(self) -> None:
+        # Reuse the option set's value and label lists instead of building them for every select
+        if self.options is self._option_set.options:
+            self._values = self._option_set.values
+            self._labels = self._option_set.labels
+        else:
+            super()._update_values_and_labels()
+
+    def _update_options(self) -> None:
+        # Same as ChoiceElement._update_options, but without serializing the options into the element's props
+        before_value = self.value
+        self._props[self.VALUE_PROP] = self._value_to_model_value(before_value)
+        if not isinstance(before_value, list):
+            self.value = before_value if before_value in self._values else None
+
+
+_option_sets: Dict[str, _OptionSet] = {}
+_option_set_clients: 'weakref.WeakKeyDictionary[Client, set]' = weakref.WeakKeyDictionary()
+
+_OPTION_SET_LOADER = '''
+  window.shadcnOptionSets = window.shadcnOptionSets || {};
+  window.shadcnLoadOptions = window.shadcnLoadOptions || ((name, url) => {
+    if (name in shadcnOptionSets) return;
+    shadcnOptionSets[name] = undefined;
+    fetch(url).then((response) => response.json()).then((options) => {
+      shadcnOptionSets[name] = options;
+      if (typeof mounted_app !== "undefined" && mounted_app) mounted_app.$forceUpdate();
+    });
+  });
+'''
+
+
+def register_options(name: str, options: Union[list, dict]) -> str:
+    """Register a named option set that many select fields can share.
+
+    The options are held once in server memory and serialized once. Browsers fetch them
+    as a static JSON asset (with ETag and long-lived Cache-Control headers) instead of
+    receiving a copy inside every select element. Treat the options as immutable.
+
+    Args:
+        name: Unique name of the option set (letters, digits, '-' and '_')
+        options: A list of values or a dictionary mapping values to labels
+
+    Returns:
+        The URL of the JSON asset
+
+    Example:
+        register_options('countries', country_names)
+
+        select('countries', label='Country')
+    """
+    if not name.replace('-', '').replace('_', '').isalnum():
+        raise ValueError(f'Invalid option set name: {name!r}')
+    if name in _option_sets:
+        raise ValueError(f'Option set {name!r} is already registered')
+    _register_option_set_route()
+    _option_sets[name] = _OptionSet(name, options)
+    return _option_sets[name].url
+
+
+@functools.lru_cache(maxsize=None)
+def _register_option_set_route():
+    from fastapi import Request, Response
+
+    @app.get('/_shadcn/options/{name}.json', include_in_schema=False)
+    def serve_option_set(name: str, request: Request):
+        option_set = _option_sets.get(name)
+        if option_set is None:
+            return Response(status_code=404)
+        headers = {'ETag': f'"{option_set.etag}"', 'Cache-Control': 'public, max-age=31536000, immutable'}
+        if request.headers.get('if-none-match') == headers['ETag']:
+            return Response(status_code=304, headers=headers)
+        return Response(option_set.payload, media_type='application/json', headers=headers)
+
+
+def _shared_option_select(name: str, value) -> ui.select:
+    """Create a select that loads the registered option set in the browser."""
+    option_set = _option_sets.get(name)
+    if option_set is None:
+        raise ValueError(f'Unknown option set {name!r}, register it with register_options() first')
+
+    select_field = _SharedOptionSelect(option_set, value=value)
+    select_field._props[':options'] = f'window.shadcnOptionSets?.[{json.dumps(name)}] ?? []'
+
+    client = context.client
+    loaded = _option_set_clients.setdefault(client, set())
+    if name not in loaded:
+        script = f'{"" if loaded else _OPTION_SET_LOADER}shadcnLoadOptions({json.dumps(name)}, {json.dumps(option_set.url)});'
+        loaded.add(name)
+        if getattr(client, '_response_built', client.has_socket_connection):  # no _response_built before NiceGUI 3
+            # Scripts inserted into a delivered page are not executed, e.g. for selects built in event handlers
+            ui.run_javascript(script)
+        else:
+            ui.add_body_html(f'<script>{script}</script>')
+
+    return select_field
+
+
+def select(
+    options: Union[list, str],
+    label: str = '',
+    value=None,
+    search: Optional[Callable[[str], Union[List, Awaitable[List]]]] = None,
+    debounce_ms: int = 300,
+    min_query_length: int = 2,
+    limit: int = 50,
+    cache_size: int = 128,
+    update_on: str = 'change',
+    name: Optional[str] = None,
+    rules: Optional[Dict[str, str]] = None,
+    required: bool = False,
+    compact: bool = False,
+    font_family: Optional[str] = None,
+    additional_classes: str = ''
+):
     """Create a shadcn-style select field
 
     Args:
-        options: List of options
+        options: List of options (initial options in search mode), or the name of an option set
+                 registered with ``register_options``
         label: Select label
         value: Initial value
+        search: Optional (async) callback returning the options matching a query; only the
+                matching options are sent to the browser
+        debounce_ms: Minimum delay between two searches while typing in search mode (default: 300)
+        min_query_length: Minimum query length before searching (default: 2)
+        limit: Maximum number of options shown per query (default: 50)
+        cache_size: Number of recent queries whose results are cached (default: 128)
+        update_on: When to send the selection to the server: 'change' (on every selection, default)
+                   or 'blur' (when the field loses focus; not in search mode)
+        name: Key of the value when used inside a form (default: the label)
+        rules: Optional validation rules checked in the browser, mapping error messages to
+               JavaScript conditions on ``val``
+        required: Whether a value must be selected
+        compact: Render a single element with the label inside the field instead of a
+                 column with a separate label (for forms with many fields)
         font_family: Optional custom font family (overrides global font)
         additional_classes: Additional Tailwind classes
+
+    Example:
+        async def find_customers(query):
+            return await db.customer_names(prefix=query)
+
+        select([], label='Customer', search=find_customers)
     """
+    if update_on not in ('change', 'blur'):
+        raise ValueError(f"update_on must be 'change' or 'blur', not {update_on!r}")
+    if search is not None and (update_on == 'blur' or _enclosing_form(context.slot) is not None):
+        # Updating the options resends all props, which would reset a selection kept in the browser
+        raise ValueError('A select in search mode syncs every selection and cannot be used with update_on=\'blur\' or in a form')
     theme = ThemeConfig.get_theme()
     font = font_family or FontConfig.get_font()
 
-    with ui.column().classes('w-full gap-1'):
+    def create_field():
+        if isinstance(options, str):
+            return _shared_option_select(options, value)
+        return ui.select(options, value=value, with_input=search is not None)
+
+    if compact:
+        # A single element: Quasar renders the label inside the field
+        select_field = create_field().props('stack-label')
         if label:
-            label_elem = ui.label(label).classes(f'text-sm font-medium {theme["text-primary"]}')
-            label_elem.style(f'font-family: {font}')
-        select_field = ui.select(options, value=value)
-        select_field.classes(f'w-full {theme["input-bg"]} {theme["text-primary"]} {additional_classes}'.strip())
-        select_field.props('outlined dense borderless')
-        select_field.style(f'font-family: {font}')
+            select_field._props['label'] = label
+    else:
+        with ui.column().classes('w-full gap-1'):
+            if label:
+                label_elem = ui.label(label).classes(f'text-sm font-medium {theme["text-primary"]}')
+                label_elem.style(f'font-family: {font}')
+            select_field = create_field()
+    select_field.classes(f'w-full {theme["input-bg"]} {theme["text-primary"]} {additional_classes}'.strip())
+    select_field.props('outlined dense borderless')
+    select_field.style(f'font-family: {font}')
+
+    if update_on == 'blur':
+        _sync_value_on(select_field, 'blur')
+    _validation_rules(select_field, rules, required)
+    _register_form_field(select_field, name or label)
+
+    if search is not None:
+        cache = _LRUCache(cache_size)
+        latest = {'query': None}
+
+        async def handle_query(e):
+            query = (e.args or '').strip()
+            if len(query) < min_query_length:
+                return
+            latest['query'] = query
+            results = cache.get(query)
+            if results is None:
+                results = search(query)
+                if inspect.isawaitable(results):
+                    results = await results
+                results = list(results)[:limit]
+                cache.set(query, results)
+            if latest['query'] != query:
+                return  # a newer query was typed while this one was running
+
+            # Keep the current selection selectable
+            selected = select_field.value if isinstance(select_field.value, list) else [select_field.value]
+            missing = [item for item in selected if item is not None and item not in results]
+            select_field.set_options(missing + results)
+
+        # NiceGUI's select filters in the browser and forwards the typed text as "input-value";
+        # throttling with trailing events only sends the latest text per interval
+        select_field.on('input-value', handle_query, throttle=debounce_ms / 1000, leading_events=False)
 
     return select_field
 
 
+class _StaticNode:
+    """Plain HTML element of a static subtree, rendered once instead of being tracked as a NiceGUI element."""
+
+    def __init__(self, tag: str, classes: str = '', style: str = '', text: str = '', attributes: Optional[Dict[str, str]] = None):
+        self.tag = tag
+        self.classes = classes
+        self.style = style
+        self.text = text
+        self.attributes = attributes or {}
+        self.children: List['_StaticNode'] = []
+
+    def add(self, tag: str, classes: str = '', style: str = '', text: str = '', attributes: Optional[Dict[str, str]] = None) -> '_StaticNode':
+        child = _StaticNode(tag, classes, style, text, attributes)
+        self.children.append(child)
+        return child
+
+    def render(self) -> str:
+        attributes = {'class': self.classes, 'style': self.style, **self.attributes}
+        attributes_html = ''.join(f' {key}="{html.escape(value)}"' for key, value in attributes.items() if value)
+        if self.tag in ('hr', 'img'):
+            return f'<{self.tag}{attributes_html}>'
+        return f'<{self.tag}{attributes_html}>{html.escape(self.text)}{self.render_children()}</{self.tag}>'
+
+    def render_children(self) -> str:
+        return ''.join(child.render() for child in self.children)
+
+    def __enter__(self):
+        _static_stacks[context.client].append(self)
+        return self
+
+    def __exit__(self, *_):
+        _static_stacks[context.client].pop()
+
+
+_static_stacks: 'weakref.WeakKeyDictionary[Client, List[_StaticNode]]' = weakref.WeakKeyDictionary()
+
+
+def _static_parent() -> Optional[_StaticNode]:
+    """Return the static node new static components are added to, or None outside of ``static()``."""
+    stack = _static_stacks.get(context.client)
+    return stack[-1] if stack else None
+
+
+class _StaticHtml(ui.html):
+    """ui.html whose content is built from the static components created inside it."""
+
+    def __init__(self):
+        super().__init__('', **_HTML_OPTIONS)
+        self.root = _StaticNode('div')
+
+    def __enter__(self):
+        # Also enter the slot, so that non-static elements created by mistake are caught on exit
+        super().__enter__()
+        _static_stacks.setdefault(self.client, []).append(self.root)
+        return self
+
+    def __exit__(self, exc_type, *_):
+        _static_stacks[self.client].pop()
+        super().__exit__(exc_type, *_)
+        if self.default_slot.children:
+            self.clear()
+            if exc_type is None:
+                raise ValueError('Only static components can be created inside static() or cached_fragment()')
+        self.set_content(self.root.render_children())
+
+
+def static(additional_classes: str = ''):
+    """Render static components into a single HTML element
+
+    Headings, badges, separators, avatars and cards with title/subtitle/content created inside
+    the context are rendered to one HTML fragment with the same classes, instead of one NiceGUI
+    element each. Only use static components inside (other elements raise a ValueError); the fragment
+    cannot be updated later.
+
+    Args:
+        additional_classes: Additional Tailwind classes
+
+    Returns:
+        ui.html object (use as a context manager)
+
+    Example:
+        with static():
+            heading('Team', level=2)
+            for member in members:
+                with card(padding='p-4'):
+                    avatar(fallback_text=member.initials)
+                    badge(member.role, variant='secondary')
+            separator()
+    """
+    return _StaticHtml().classes(additional_classes)
+
+
+_fragment_cache = _LRUCache(maxsize=256)
+
+
+def cached_fragment(key: str, builder: Callable[[], None], ttl: Optional[float] = None, additional_classes: str = ''):
+    """Render static components once and reuse the HTML for all clients
+
+    Works like ``static()``, but the rendered HTML is cached across clients, keyed by ``key``,
+    the theme mode and the global font. The builder only runs when the fragment is not cached.
+    The least recently used of the 256 cached fragments are evicted first.
+
+    Args:
+        key: Cache key identifying the content of the fragment
+        builder: Callable creating the static components of the fragment
+        ttl: Optional number of seconds after which the fragment is rendered again
+        additional_classes: Additional Tailwind classes
+
+    Returns:
+        ui.html object
+
+    Example:
+        def hero():
+            heading('Build dashboards faster', level=1)
+            badge('New', variant='success')
+
+        cached_fragment('landing-hero', hero, ttl=3600)
+    """
+    fragment = _StaticHtml().classes(additional_classes)
+    cache_key = (key, ThemeConfig.get_mode(), FontConfig.get_font())
+    content = _fragment_cache.get(cache_key)
+    if content is None:
+        with fragment:
+            builder()
+        _fragment_cache.set(cache_key, fragment.content, ttl)
+    else:
+        fragment.set_content(content)
+    return fragment
+
+
+def _bind_methods(name: str):
+    """Return the ``bind_<name>_to``, ``bind_<name>_from`` and ``bind_<name>`` methods of a bindable property."""
+
+    def bind_property_to(self, target_object, target_name: str = name, forward: Callable = lambda x: x):
+        bind_to(self, name, target_object, target_name, forward)
+        return self
+
+    def bind_property_from(self, target_object, target_name: str = name, backward: Callable = lambda x: x):
+        bind_from(self, name, target_object, target_name, backward)
+        return self
+
+    def bind_property(self, target_object, target_name: str = name, forward: Callable = lambda x: x, backward: Callable = lambda x: x):
+        bind(self, name, target_object, target_name, forward=forward, backward=backward)
+        return self
+
+    for method, suffix, direction in ((bind_property_to, '_to', 'to'), (bind_property_from, '_from', 'from'), (bind_property, '', 'to and from')):
+        method.__name__ = f'bind_{name}{suffix}'
+        method.__doc__ = f'Bind the {name} of this element {direction} the target object\'s target_name property.'
+    return bind_property_to, bind_property_from, bind_property
+
+
+def _swap_classes(element: ui.element, old_classes: str, new_classes: str, fixed_classes: str = ''):
+    """Replace one set of classes of an element with another in a single update, never removing fixed classes."""
+    keep = set(new_classes.split()) | set(fixed_classes.split())
+    element.classes(new_classes, remove=' '.join(c for c in old_classes.split() if c not in keep))
+
+
+_HEADING_SIZES = {
+    1: 'text-4xl font-bold',
+    2: 'text-3xl font-bold',
+    3: 'text-2xl font-semibold',
+    4: 'text-xl font-semibold',
+    5: 'text-lg font-medium',
+    6: 'text-base font-medium'
+}
+
+
+class Heading(ui.label):
+    """Heading whose text and level can be changed or bound after creation."""
+
+    level = BindableProperty(on_change=lambda sender, level: sender._handle_level_change(level))
+    bind_level_to, bind_level_from, bind_level = _bind_methods('level')
+
+    def __init__(self, text: str, level: int, classes: str = ''):
+        super().__init__(text)
+        self.level = level
+        self._fixed_classes = classes
+        self._level_classes = _HEADING_SIZES.get(level, _HEADING_SIZES[3])
+        self.classes(f'{self._level_classes} {classes}'.strip())
+
+    def set_level(self, level: int):
+        self.level = level
+
+    def _handle_level_change(self, level: int):
+        level_classes = _HEADING_SIZES.get(level, _HEADING_SIZES[3])
+        _swap_classes(self, self._level_classes, level_classes, self._fixed_classes)
+        self._level_classes = level_classes
+
+
 def heading(text: str, level: int = 3, color: str = '', font_family: Optional[str] = None, additional_classes: str = ''):
     """Create a shadcn-style heading
 
@@ -289,22 +1065,109 @@ def heading(text: str, level: int = 3, color: str = '', font_family: Optional[st
         color: Tailwind color class (default: uses theme text-primary)
         font_family: Optional custom font family (overrides global font)
         additional_classes: Additional Tailwind classes
+
+    Returns:
+        Heading object (a ui.label with bindable ``text`` and ``level``)
+
+    Example:
+        title = heading('Orders', level=2)
+        title.bind_text_from(state, 'page_title')
+        title.set_level(3)
     """
     theme = ThemeConfig.get_theme()
-    size_classes = {
-        1: 'text-4xl font-bold',
-        2: 'text-3xl font-bold',
-        3: 'text-2xl font-semibold',
-        4: 'text-xl font-semibold',
-        5: 'text-lg font-medium',
-        6: 'text-base font-medium'
-    }
 
     text_color = color if color else theme['text-primary']
-    classes = f'{size_classes.get(level, size_classes[3])} {text_color} {additional_classes}'.strip()
     font = font_family or FontConfig.get_font()
-    heading = ui.label(text).classes(classes)
+    static_parent = _static_parent()
+    if static_parent is not None:
+        classes = f'{_HEADING_SIZES.get(level, _HEADING_SIZES[3])} {text_color} {additional_classes}'.strip()
+        return static_parent.add('div', classes, f'font-family: {font}', text)
+    heading = Heading(text, level, f'{text_color} {additional_classes}'.strip())
     heading.style(f'font-family: {font}')
+    return heading
+
+
+def _card_variant_classes(variant: str = 'default') -> str:
+    """Return the variant-specific Tailwind classes of a shadcn-style card."""
+    theme = ThemeConfig.get_theme()
+
+    # Variant-specific classes
+    variant_classes = {
+        'default': f'border {theme["border-default"]} shadow-none',
+        'dashed': f'border border-dashed {theme["border-strong"]} shadow-none',
+        'elevated': f'border {theme["border-default"]} shadow-md',
+        'ghost': 'shadow-none',
+    }
+
+    return variant_classes.get(variant, variant_classes['default'])
+
+
+class Card(ui.card):
+    """Card whose variant, title, subtitle and content text can be changed or bound after creation.
+
+    The title, subtitle and content labels are created the first time their text is not empty.
+    """
+
+    variant = BindableProperty(on_change=lambda sender, variant: sender._handle_variant_change(variant))
+    title = BindableProperty(on_change=lambda sender, text: sender._handle_text_change('title', text))
+    subtitle = BindableProperty(on_change=lambda sender, text: sender._handle_text_change('subtitle', text))
+    card_content = BindableProperty(on_change=lambda sender, text: sender._handle_text_change('card_content', text))
+    bind_variant_to, bind_variant_from, bind_variant = _bind_methods('variant')
+    bind_title_to, bind_title_from, bind_title = _bind_methods('title')
+    bind_subtitle_to, bind_subtitle_from, bind_subtitle = _bind_methods('subtitle')
+    bind_card_content_to, bind_card_content_from, bind_card_content = _bind_methods('card_content')
+
+    def __init__(self, variant: str, title: Optional[str], subtitle: Optional[str], card_content: Optional[str], classes: str = '',
+                 font: str = ''):
+        super().__init__()
+        self.variant = variant
+        self.title = title
+        self.subtitle = subtitle
+        self.card_content = card_content
+        self.labels: Dict[str, ui.label] = {}
+        self._header: Optional[ui.column] = None
+        self._font = font
+        self._fixed_classes = classes
+        self._variant_classes = _card_variant_classes(variant)
+        self.classes(f'{self._variant_classes} {classes}'.strip())
+        for name in ('title', 'subtitle', 'card_content'):
+            if getattr(self, name):
+                self._add_label(name, getattr(self, name))
+
+    def set_variant(self, variant: str):
+        self.variant = variant
+
+    def _handle_variant_change(self, variant: str):
+        variant_classes = _card_variant_classes(variant)
+        _swap_classes(self, self._variant_classes, variant_classes, self._fixed_classes)
+        self._variant_classes = variant_classes
+
+    def _handle_text_change(self, name: str, text: Optional[str]):
+        if name in self.labels:
+            self.labels[name].set_text(text or '')
+        elif text:
+            self._add_label(name, text)
+
+    def _add_label(self, name: str, text: str):
+        """Create the title, subtitle or content label in its place, before any custom content."""
+        theme = ThemeConfig.get_theme()
+        if name == 'card_content':
+            container, index = self, int(self._header is not None)
+            classes = f'text-sm {theme["text-primary"]}'
+        else:
+            if self._header is None:
+                with self:
+                    self._header = ui.column().classes('gap-1 mb-4')
+                if self.default_slot.children[0] is not self._header:
+                    self._header.move(self, target_index=0)
+            container, index = self._header, 0 if name == 'title' else int('title' in self.labels)
+            classes = f'text-lg font-semibold {theme["text-primary"]}' if name == 'title' else f'text-sm {theme["text-secondary"]}'
+
+        with container:
+            label = ui.label(text).classes(classes).style(f'font-family: {self._font}')
+        if container.default_slot.children[index] is not label:
+            label.move(container, target_index=index)
+        self.labels[name] = label
 
 
 def card(
@@ -332,7 +1195,8 @@ def card(
         font_family: Optional custom font family (overrides global font)
 
     Returns:
-        The card element (use as context manager if title/subtitle/content not provided)
+        Card object (use as context manager if title/subtitle/content not provided); its
+        ``variant``, ``title``, ``subtitle`` and ``card_content`` are bindable
 
     Example:
         # Simple card with context manager
@@ -341,56 +1205,94 @@ def card(
 
         # Card with title and content
         card(title='My Card', subtitle='Description', card_content='Content here')
+
+        # Card following the state of a job
+        card(title='Import', card_content='Waiting').bind_card_content_from(job, 'status')
     """
     theme = ThemeConfig.get_theme()
 
     # Base card classes
     base_classes = f'rounded-lg {theme["card-bg"]}'
+    classes = f'{base_classes} {width} {margin} {padding} {additional_classes}'.strip()
+
+    static_parent = _static_parent()
+    if static_parent is not None:
+        return _static_card(static_parent, f'{classes} {_card_variant_classes(variant)}', title, subtitle, card_content, font_family)
+
+    # The title, subtitle and content labels are created by the card, now or when first set
+    return Card(variant, title, subtitle, card_content, classes, font_family or FontConfig.get_font())
+
+
+def _static_card(parent: _StaticNode, classes: str, title, subtitle, card_content, font_family) -> _StaticNode:
+    """Static counterpart of the card element and its title, subtitle and content labels."""
+    theme = ThemeConfig.get_theme()
+    font = font_family or FontConfig.get_font()
+
+    card_node = parent.add('div', f'q-card nicegui-card {classes}')
+    if title or subtitle:
+        header = card_node.add('div', 'nicegui-column gap-1 mb-4')
+        if title:
+            header.add('div', f'text-lg font-semibold {theme["text-primary"]}', f'font-family: {font}', title)
+        if subtitle:
+            header.add('div', f'text-sm {theme["text-secondary"]}', f'font-family: {font}', subtitle)
+    if card_content:
+        card_node.add('div', f'text-sm {theme["text-primary"]}', f'font-family: {font}', card_content)
+    return card_node
 
-    # Variant-specific classes
-    variant_classes = {
-        'default': f'border {theme["border-default"]} shadow-none',
-        'dashed': f'border border-dashed {theme["border-strong"]} shadow-none',
-        'elevated': f'border {theme["border-default"]} shadow-md',
-        'ghost': 'shadow-none',
-    }
 
-    variant_class = variant_classes.get(variant, variant_classes['default'])
-    classes = f'{base_classes} {variant_class} {width} {margin} {padding} {additional_classes}'.strip()
+def client_toggle(trigger: ui.element, target: ui.element, action: str = 'toggle'):
+    """Open or close a client-side expandable, accordion item or dialog from the browser.
 
-    card_element = ui.card().classes(classes)
+    The click is handled in the browser only, no event is sent to the server.
+
+    Args:
+        trigger: Element whose click toggles the target (e.g. a button)
+        target: Element created with ``client_side=True``
+        action: 'toggle', 'show' or 'hide' (default: 'toggle')
 
-    # If title, subtitle, or content provided, create structured card
-    if title or subtitle or card_content:
-        font = font_family or FontConfig.get_font()
+    Returns:
+        The trigger element
 
-        with card_element:
-            if title or subtitle:
-                with ui.column().classes('gap-1 mb-4'):
-                    if title:
-                        title_label = ui.label(title).classes(f'text-lg font-semibold {theme["text-primary"]}')
-                        title_label.style(f'font-family: {font}')
-                    if subtitle:
-                        subtitle_label = ui.label(subtitle).classes(f'text-sm {theme["text-secondary"]}')
-                        subtitle_label.style(f'font-family: {font}')
+    Example:
+        confirm = dialog('Delete file?', client_side=True)
+        client_toggle(button('Delete', variant='destructive'), confirm, 'show')
+    """
+    trigger.on('click', js_handler=f'() => getElement({target.id}).{action}()')
+    return trigger
 
-            if card_content:
-                content_label = ui.label(card_content).classes(f'text-sm {theme["text-primary"]}')
-                content_label.style(f'font-family: {font}')
 
-    return card_element
+def _sync_open_state(element: ui.element, on_sync: Callable[[bool], None], sync_interval: float):
+    """Report the open state of a client-side element, at most once per interval with the latest value."""
+    element.on('update:model-value', lambda e: on_sync(e.args), [None], throttle=sync_interval, leading_events=False)
 
 
-def expandable(text: str, width: str = 'w-full', additional_classes: str = ''):
+def expandable(
+    text: str,
+    width: str = 'w-full',
+    client_side: bool = False,
+    on_sync: Optional[Callable[[bool], None]] = None,
+    sync_interval: float = 1.0,
+    additional_classes: str = ''
+):
     """Create a shadcn-style expandable/accordion component
 
     Args:
         text: Expansion header text
         width: Width classes (default: 'w-full')
+        client_side: Keep the open/closed state in the browser only (no server round trip on toggle)
+        on_sync: Optional callback receiving the open state of a client-side expandable
+        sync_interval: Minimum seconds between two ``on_sync`` calls (default: 1.0)
         additional_classes: Additional Tailwind classes
     """
     classes = f'{width} {additional_classes}'.strip()
-    return ui.expansion(text).classes(classes)
+    if not client_side:
+        return ui.expansion(text).classes(classes)
+
+    expansion = ui.element('q-expansion-item').classes(f'nicegui-expansion {classes}')
+    expansion._props['label'] = text
+    if on_sync:
+        _sync_open_state(expansion, on_sync, sync_interval)
+    return expansion
 
 
 def table(columns: List[Dict], rows: List[Dict], additional_classes: str = ''):
@@ -421,15 +1323,27 @@ def table(columns: List[Dict], rows: List[Dict], additional_classes: str = ''):
     return table
 
 
-def dialog(title: str = '', additional_classes: str = ''):
+def dialog(
+    title: str = '',
+    builder: Optional[Callable[[], None]] = None,
+    client_side: bool = False,
+    on_sync: Optional[Callable[[bool], None]] = None,
+    sync_interval: float = 1.0,
+    additional_classes: str = ''
+):
     """Create a shadcn-style dialog/modal
 
     Args:
         title: Dialog title (optional)
+        builder: Optional callable building the dialog content; the card, title and content
+                 are then only created when the dialog is opened for the first time
+        client_side: Open and close the dialog in the browser only, using ``client_toggle``
+        on_sync: Optional callback receiving the open state of a client-side dialog
+        sync_interval: Minimum seconds between two ``on_sync`` calls (default: 1.0)
         additional_classes: Additional Tailwind classes
 
     Returns:
-        ui.dialog object that can be used with context manager
+        ui.dialog object that can be used with context manager (a q-dialog element if client_side)
 
     Example:
         with dialog('Confirm Action') as dialog:
@@ -437,80 +1351,468 @@ def dialog(title: str = '', additional_classes: str = ''):
             with ui.row():
                 button('Cancel', on_click=dialog.close, variant='outline')
                 button('Confirm', on_click=lambda: (do_action(), dialog.close()))
+
+        # Built on first open
+        settings = dialog('Settings', builder=build_settings_form)
+        button('Settings', on_click=settings.open)
     """
     theme = ThemeConfig.get_theme()
-    dialog = ui.dialog()
-
-    with dialog, ui.card().classes(f'{theme["card-bg"]} p-6 min-w-96 max-w-2xl {additional_classes}'.strip()):
-        if title:
-            heading(title, level=3)
-            ui.separator().classes('my-4')
+    dialog = ui.element('q-dialog') if client_side else ui.dialog()
+
+    def build_card():
+        with dialog, ui.card().classes(f'{theme["card-bg"]} p-6 min-w-96 max-w-2xl {additional_classes}'.strip()):
+            if title:
+                heading(title, level=3)
+                ui.separator().classes('my-4')
+
+            # Content will be added by the context manager
+            content_container = ui.column().classes('w-full gap-4')
+            if builder is not None:
+                with content_container:
+                    builder()
+
+    def build_on_first_open(e):
+        if e.value and not dialog.default_slot.children:
+            build_card()
+
+    if builder is None:
+        build_card()
+    elif client_side:
+        dialog.on('before-show.once', build_card)
+    else:
+        dialog.on_value_change(build_on_first_open)
 
-        # Content will be added by the context manager
-        content_container = ui.column().classes('w-full gap-4')
+    if client_side and on_sync:
+        _sync_open_state(dialog, on_sync, sync_interval)
 
     return dialog
 
 
-def badge(text: str, variant: str = 'default', additional_classes: str = '', font_family: Optional[str] = None):
-    """Create a shadcn-style badge
-
-    Args:
-        text: Badge text
-        variant: 'default', 'secondary', 'destructive', 'outline', 'success'
-        additional_classes: Additional Tailwind classes
-        font_family: Optional custom font family (overrides global font)
-    """
+def _skeleton(classes: str = '') -> ui.element:
+    """Create a pulsing shadcn-style placeholder block."""
     theme = ThemeConfig.get_theme()
-
-    # Base classes for all badges
-    base_classes = 'inline-flex items-center rounded-full px-2.5 py-0.5 text-xs font-semibold transition-colors'
-
-    # Variant-specific classes
-    variant_classes = {
-        'default': f'{theme["button-primary-bg"]} {theme["active-text"]} {theme["button-primary-hover"]}',
-        'secondary': f'{theme["button-secondary-bg"]} {theme["text-primary"]} {theme["button-secondary-hover"]}',
-        'destructive': f'{theme["destructive-bg"]} {theme["active-text"]} {theme["destructive-hover"]}',
-        'outline': f'border {theme["border-strong"]} {theme["text-primary"]} {theme["bg-primary"]}',
-        'success': f'{theme["success-bg"]} {theme["text-inverse"]} {theme["success-hover"]}',
-    }
-
-    classes = f'{base_classes} {variant_classes.get(variant, variant_classes["default"])} {additional_classes}'.strip()
-
-    font = font_family or FontConfig.get_font()
-    badge = ui.label(text).classes(classes)
-    badge.style(f'font-family: {font}')
-    return badge
+    return ui.element('div').classes(f'animate-pulse rounded-md {theme["bg-muted"]} {classes}'.strip())
 
 
-def avatar(
-    image_url: Optional[str] = None,
-    fallback_text: str = '',
-    size: str = 'md',
-    variant: str = 'circle',
-    font_family: Optional[str] = None,
+def lazy_section(
+    builder: Callable[[], Optional[Awaitable]],
+    height: str = '16rem',
     additional_classes: str = ''
 ):
-    """Create a shadcn-style avatar
+    """Create a section that is only built when it scrolls into view
+
+    Until then, a skeleton placeholder of the given height is shown. The browser reports
+    the visibility once, then the (async) builder creates the content on the server.
 
     Args:
-        image_url: URL of the avatar image (if None, shows fallback text)
-        fallback_text: Text to show when image is not available (usually initials)
-        size: 'sm', 'md', 'lg', 'xl' (default: 'md')
-        variant: 'circle' or 'square' (default: 'circle')
-        font_family: Optional custom font family (overrides global font)
+        builder: Callable building the section content
+        height: CSS height of the placeholder (default: '16rem')
         additional_classes: Additional Tailwind classes
 
     Returns:
-        The NiceGUI element containing the avatar
+        The section element
 
     Example:
-        # With image
-        avatar(image_url='https://example.com/avatar.jpg')
+        def build_sales():
+            barchart(load_sales(), title='Sales')
+
+        lazy_section(build_sales, height='400px')
+    """
+    section = ui.element('q-intersection').props('once transition=none')
+    section.classes(f'w-full {additional_classes}'.strip())
+    section.style(f'min-height: {height}')
+    with section:
+        _skeleton('w-full').style(f'height: {height}')
+
+    state = {'built': False}
+
+    async def build(e):
+        if not e.args or state['built']:
+            return
+        state['built'] = True
+        section.clear()
+        with section:
+            result = builder()
+            if inspect.isawaitable(result):
+                await result
+        section.style(remove=f'min-height: {height}')
+
+    section.on('visibility', build)
+    return section
+
+
+class _ConfirmDialog:
+    """Confirmation dialog shared by all ``confirm`` calls of one client."""
+
+    def __init__(self):
+        theme = ThemeConfig.get_theme()
+        font = FontConfig.get_font()
+
+        self.lock = asyncio.Lock()
+        with ui.dialog() as self.dialog, ui.card().classes(f'{theme["card-bg"]} p-6 min-w-96 max-w-2xl'):
+            self.title = heading('', level=4)
+            self.message = ui.label().classes(f'text-sm {theme["text-secondary"]}')
+            self.message.style(f'font-family: {font}')
+            with ui.row().classes('w-full gap-2 mt-4 justify-end'):
+                self.cancel_button = button('', on_click=lambda: self.dialog.submit(False), variant='outline')
+                self.confirm_button = button('', on_click=lambda: self.dialog.submit(True))
+
+
+_confirm_dialogs: 'weakref.WeakKeyDictionary[Client, _ConfirmDialog]' = weakref.WeakKeyDictionary()
+
+
+async def confirm(
+    title: str,
+    message: str = '',
+    confirm_text: str = 'Continue',
+    cancel_text: str = 'Cancel',
+    variant: str = 'default'
+) -> bool:
+    """Ask the user for confirmation in a shadcn-style dialog.
+
+    Each client has a single confirmation dialog that is created on first use and
+    re-populated for every later call, instead of building a new dialog each time.
+
+    Args:
+        title: Dialog title
+        message: Dialog message
+        confirm_text: Text of the confirm button (default: 'Continue')
+        cancel_text: Text of the cancel button (default: 'Cancel')
+        variant: Variant of the confirm button, e.g. 'destructive' (default: 'default')
+
+    Returns:
+        True if the user confirmed, False otherwise
+
+    Example:
+        async def delete_account():
+            if await confirm('Are you absolutely sure?', 'This action cannot be undone.', variant='destructive'):
+                ...
+    """
+    client = context.client
+    shared = _confirm_dialogs.get(client)
+    if shared is None:
+        with client.layout:
+            shared = _confirm_dialogs[client] = _ConfirmDialog()
+
+    async with shared.lock:
+        shared.title.set_text(title)
+        shared.message.set_text(message)
+        shared.message.set_visibility(bool(message))
+        shared.cancel_button.set_text(cancel_text)
+        shared.confirm_button.set_text(confirm_text)
+        shared.confirm_button.classes(replace=_button_classes(variant))
+        return bool(await shared.dialog)
+
+
+class Badge(ui.label):
+    """Badge whose text and variant can be changed or bound after creation."""
+
+    variant = BindableProperty(on_change=lambda sender, variant: sender._handle_variant_change(variant))
+    bind_variant_to, bind_variant_from, bind_variant = _bind_methods('variant')
+
+    def __init__(self, text: str, variant: str, classes: str = ''):
+        super().__init__(text)
+        self.variant = variant
+        self._fixed_classes = classes
+        self._variant_classes = _badge_variant_classes(variant)
+        self.classes(f'{self._variant_classes} {classes}'.strip())
+
+    def set_variant(self, variant: str):
+        self.variant = variant
+
+    def _handle_variant_change(self, variant: str):
+        variant_classes = _badge_variant_classes(variant)
+        _swap_classes(self, self._variant_classes, variant_classes, self._fixed_classes)
+        self._variant_classes = variant_classes
+
+
+def badge(text: str, variant: str = 'default', additional_classes: str = '', font_family: Optional[str] = None):
+    """Create a shadcn-style badge
+
+    Args:
+        text: Badge text
+        variant: 'default', 'secondary', 'destructive', 'outline', 'success'
+        additional_classes: Additional Tailwind classes
+        font_family: Optional custom font family (overrides global font)
+
+    Returns:
+        Badge object (a ui.label with bindable ``text`` and ``variant``)
+
+    Example:
+        status = badge('Pending', variant='secondary')
+        status.bind_variant_from(order, 'status', backward=lambda s: 'success' if s == 'paid' else 'secondary')
+    """
+    font = font_family or FontConfig.get_font()
+    static_parent = _static_parent()
+    if static_parent is not None:
+        return static_parent.add('div', _badge_classes(variant, additional_classes), f'font-family: {font}', text)
+    badge = Badge(text, variant, f'{_BADGE_BASE_CLASSES} {additional_classes}'.strip())
+    badge.style(f'font-family: {font}')
+    return badge
+
+
+# Base classes for all badges
+_BADGE_BASE_CLASSES = 'inline-flex items-center rounded-full px-2.5 py-0.5 text-xs font-semibold transition-colors'
+
+
+def _badge_classes(variant: str = 'default', additional_classes: str = '') -> str:
+    """Return the Tailwind classes of a shadcn-style badge."""
+    return f'{_BADGE_BASE_CLASSES} {_badge_variant_classes(variant)} {additional_classes}'.strip()
+
+
+def _badge_variant_classes(variant: str = 'default') -> str:
+    """Return the variant-specific Tailwind classes of a shadcn-style badge."""
+    theme = ThemeConfig.get_theme()
+
+    # Variant-specific classes
+    variant_classes = {
+        'default': f'{theme["button-primary-bg"]} {theme["active-text"]} {theme["button-primary-hover"]}',
+        'secondary': f'{theme["button-secondary-bg"]} {theme["text-primary"]} {theme["button-secondary-hover"]}',
+        'destructive': f'{theme["destructive-bg"]} {theme["active-text"]} {theme["destructive-hover"]}',
+        'outline': f'border {theme["border-strong"]} {theme["text-primary"]} {theme["bg-primary"]}',
+        'success': f'{theme["success-bg"]} {theme["text-inverse"]} {theme["success-hover"]}',
+    }
+
+    return variant_classes.get(variant, variant_classes['default'])
+
+
+_AVATAR_PIXELS = {'sm': 32, 'md': 40, 'lg': 48, 'xl': 64}
+_avatar_sources = _LRUCache(maxsize=4096)
+_avatar_thumbnails = _LRUCache(maxsize=512)
+_AVATAR_CACHE_FILES = 4096  # thumbnails kept on disk, least recently used are deleted first
+_AVATAR_URL_REFRESH = 86400  # seconds after which images from URLs are fetched again
+
+
+def _avatar_thumbnail_url(image_url: str, size: str) -> Optional[str]:
+    """Register the image as a thumbnail source and return the thumbnail URL (None if it cannot be read)."""
+    if not image_url.startswith(('http://', 'https://')) and not Path(image_url).is_file():
+        return None
+    try:
+        import PIL  # noqa: F401
+    except ImportError as e:
+        raise ImportError('Avatar thumbnails require Pillow: pip install "shadcn-nicegui[images]"') from e
+
+    # The id changes with the image (file modification time and size, or daily for URLs), so thumbnails
+    # can be cached as immutable; only registered sources are served, so the route is not an open proxy
+    if image_url.startswith(('http://', 'https://')):
+        version = str(int(time.time() // _AVATAR_URL_REFRESH))
+    else:
+        stat = Path(image_url).stat()
+        version = f'{stat.st_mtime_ns}-{stat.st_size}'
+    source_id = hashlib.sha256(f'{image_url}\n{version}'.encode()).hexdigest()[:32]
+    _avatar_sources.set(source_id, image_url)
+    _register_avatar_route()
+    pixels = 2 * _AVATAR_PIXELS.get(size, _AVATAR_PIXELS['md'])  # sharp on high-density displays
+    return f'/_shadcn/avatars/{source_id}/{pixels}.webp'
+
+
+def _avatar_thumbnail(source_id: str, pixels: int) -> Tuple[bytes, str]:
+    """Return the WebP thumbnail of a registered source and its ETag, resized once and cached."""
+    cached = _avatar_thumbnails.get((source_id, pixels))
+    if cached is not None:
+        return cached
+
+    directory = AvatarCacheConfig.get_directory()
+    path = directory / f'{source_id}-{pixels}.webp'
+    if path.exists():
+        data = path.read_bytes()
+        path.touch()  # the modification time orders the disk cache by last use
+    else:
+        import urllib.request
+        from PIL import Image, ImageOps
+
+        source = _avatar_sources.get(source_id)
+        if source is None:
+            raise FileNotFoundError(f'Unknown avatar source {source_id}')
+        if source.startswith(('http://', 'https://')):
+            with urllib.request.urlopen(source, timeout=10) as response:
+                raw = response.read()
+        else:
+            raw = Path(source).read_bytes()
+        with Image.open(io.BytesIO(raw)) as image:
+            thumbnail = ImageOps.fit(ImageOps.exif_transpose(image).convert('RGBA'), (pixels, pixels))
+        buffer = io.BytesIO()
+        thumbnail.save(buffer, 'WEBP', quality=85)
+        data = buffer.getvalue()
+
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, staging = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(staging, path)  # atomic publish
+        _evict_avatar_thumbnails(directory)
+
+    result = (data, hashlib.sha256(data).hexdigest()[:32])
+    _avatar_thumbnails.set((source_id, pixels), result)
+    return result
+
+
+def _evict_avatar_thumbnails(directory: Path):
+    """Delete the least recently used thumbnails beyond the disk cache size."""
+    def last_used(path: Path) -> float:
+        try:
+            return path.stat().st_mtime
+        except OSError:
+            return 0.0
+
+    files = sorted(directory.glob('*.webp'), key=last_used)
+    for path in files[:max(len(files) - _AVATAR_CACHE_FILES, 0)]:
+        try:
+            path.unlink()
+        except OSError:  # already deleted by a concurrent request
+            pass
+
+
+@functools.lru_cache(maxsize=None)
+def _register_avatar_route():
+    from fastapi import Request, Response
+
+    allowed_pixels = {2 * pixels for pixels in _AVATAR_PIXELS.values()}
+
+    @app.get('/_shadcn/avatars/{source_id}/{pixels}.webp', include_in_schema=False)
+    async def serve_avatar(source_id: str, pixels: int, request: Request):
+        if _avatar_sources.get(source_id) is None or pixels not in allowed_pixels:
+            return Response(status_code=404)
+        try:
+            data, etag = await run.io_bound(_avatar_thumbnail, source_id, pixels)
+        except OSError:  # unreachable or invalid source image
+            return Response(status_code=404)
+        headers = {'ETag': f'"{etag}"', 'Cache-Control': 'public, max-age=31536000, immutable'}
+        if request.headers.get('if-none-match') == headers['ETag']:
+            return Response(status_code=304, headers=headers)
+        return Response(data, media_type='image/webp', headers=headers)
+
+
+_INITIALS_MAX_LENGTH = 4
+_initials_fonts: Dict[str, str] = {}
+
+
+@functools.lru_cache(maxsize=4096)
+def _initials_svg(text: str, mode: str, font: str) -> Tuple[bytes, str]:
+    """Return the SVG of an initials avatar and its ETag; the color is derived from a hash of the text."""
+    theme = Theme.DARK if mode == 'dark' else Theme.LIGHT
+    palette = theme['raw-avatar-palette'].split(',')
+    color = palette[int(hashlib.sha256(text.encode()).hexdigest(), 16) % len(palette)]
+    svg = (
+        '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100">'
+        f'<rect width="100" height="100" fill="{color}"/>'
+        f'<text x="50" y="50" dy="0.35em" text-anchor="middle" font-family="{html.escape(font)}" '
+        f'font-size="40" font-weight="500" fill="{theme["raw-text-primary"]}">{html.escape(text)}</text>'
+        '</svg>'
+    ).encode()
+    return svg, hashlib.sha256(svg).hexdigest()[:32]
+
+
+def _initials_url(text: str, font: str) -> str:
+    """Return the URL of the SVG initials avatar for the current theme mode and the given font."""
+    _register_initials_route()
+    mode = 'dark' if ThemeConfig.get_mode() == 'dark' else 'light'
+    # The font is part of the URL so that changing it never serves a stale SVG from the browser cache
+    font_id = hashlib.sha256(font.encode()).hexdigest()[:16]
+    _initials_fonts[font_id] = font
+    return f'/_shadcn/avatars/initials/{mode}/{font_id}/{urllib.parse.quote(text[:_INITIALS_MAX_LENGTH], safe="")}.svg'
+
+
+@functools.lru_cache(maxsize=None)
+def _register_initials_route():
+    from fastapi import Request, Response
+
+    @app.get('/_shadcn/avatars/initials/{mode}/{font_id}/{text}.svg', include_in_schema=False)
+    def serve_initials(mode: str, font_id: str, text: str, request: Request):
+        font = _initials_fonts.get(font_id)
+        if mode not in ('light', 'dark') or font is None or not 0 < len(text) <= _INITIALS_MAX_LENGTH:
+            return Response(status_code=404)
+        svg, etag = _initials_svg(text, mode, font)
+        headers = {'ETag': f'"{etag}"', 'Cache-Control': 'public, max-age=86400'}
+        if request.headers.get('if-none-match') == headers['ETag']:
+            return Response(status_code=304, headers=headers)
+        return Response(svg, media_type='image/svg+xml', headers=headers)
+
+
+def avatar(
+    image_url: Optional[str] = None,
+    fallback_text: str = '',
+    size: str = 'md',
+    variant: str = 'circle',
+    thumbnail: bool = False,
+    svg_fallback: bool = False,
+    font_family: Optional[str] = None,
+    additional_classes: str = ''
+):
+    """Create a shadcn-style avatar
+
+    Args:
+        image_url: URL of the avatar image (if None, shows fallback text)
+        fallback_text: Text to show when image is not available (usually initials)
+        size: 'sm', 'md', 'lg', 'xl' (default: 'md')
+        variant: 'circle' or 'square' (default: 'circle')
+        thumbnail: Serve the image (an http(s) URL or a local file) resized to the avatar size
+                   from a cached local route and render it as a single lazy-loaded image
+                   (requires Pillow)
+        svg_fallback: Render the fallback text (up to 4 characters) as a cached SVG image with a
+                      stable color derived from the text, instead of a styled label
+        font_family: Optional custom font family (overrides global font)
+        additional_classes: Additional Tailwind classes
+
+    Returns:
+        The NiceGUI element containing the avatar
+
+    Example:
+        # With image
+        avatar(image_url='https://example.com/avatar.jpg')
 
         # With fallback text
         avatar(fallback_text='JD', size='lg')
+
+        # With a thumbnail of a large image
+        avatar(image_url='https://example.com/photo.jpg', thumbnail=True)
+
+        # With fallback text as a cacheable SVG image
+        avatar(fallback_text='JD', svg_fallback=True)
     """
+    theme = ThemeConfig.get_theme()
+    base_classes = _avatar_classes(size, variant, additional_classes)
+
+    font = font_family or FontConfig.get_font()
+
+    static_parent = _static_parent()
+    if image_url and thumbnail:
+        attributes = {'src': _avatar_thumbnail_url(image_url, size) or image_url, 'alt': fallback_text, 'loading': 'lazy'}
+        if static_parent is not None:
+            return static_parent.add('img', f'{base_classes} object-cover', attributes=attributes)
+        avatar_image = ui.element('img').classes(f'{base_classes} object-cover')
+        avatar_image._props.update(attributes)
+        return avatar_image
+
+    if not image_url and svg_fallback and fallback_text:
+        attributes = {'src': _initials_url(fallback_text, font), 'alt': fallback_text, 'loading': 'lazy'}
+        if static_parent is not None:
+            return static_parent.add('img', base_classes, attributes=attributes)
+        avatar_image = ui.element('img').classes(base_classes)
+        avatar_image._props.update(attributes)
+        return avatar_image
+
+    if static_parent is not None:
+        if image_url:
+            avatar_node = static_parent.add('div', base_classes)
+            avatar_node.add('img', 'h-full w-full object-cover', attributes={'src': image_url, 'alt': fallback_text})
+            return avatar_node
+        return static_parent.add('div', f'{base_classes} font-medium {theme["text-secondary"]}', f'font-family: {font}', fallback_text)
+
+    if image_url:
+        # Create avatar with image
+        with ui.element('div').classes(base_classes) as avatar_container:
+            ui.image(image_url).classes('h-full w-full object-cover')
+        return avatar_container
+    else:
+        # Create avatar with fallback text
+        avatar_label = ui.label(fallback_text).classes(f'{base_classes} font-medium {theme["text-secondary"]}')
+        avatar_label.style(f'font-family: {font}')
+        return avatar_label
+
+
+def _avatar_classes(size: str = 'md', variant: str = 'circle', additional_classes: str = '') -> str:
+    """Return the Tailwind classes of a shadcn-style avatar."""
     # Size classes
     size_classes = {
         'sm': 'h-8 w-8 text-xs',
@@ -525,20 +1827,129 @@ def avatar(
     theme = ThemeConfig.get_theme()
 
     # Base classes
-    base_classes = f'inline-flex items-center justify-center overflow-hidden {theme["bg-accent"]} border {theme["border-default"]} {shape_class} {size_classes.get(size, size_classes["md"])} {additional_classes}'.strip()
+    return f'inline-flex items-center justify-center overflow-hidden {theme["bg-accent"]} border {theme["border-default"]} {shape_class} {size_classes.get(size, size_classes["md"])} {additional_classes}'.strip()
 
+
+def _bulk_element(node: _StaticNode):
+    """Add a collection to the current static fragment, or render it as one HTML element."""
+    static_parent = _static_parent()
+    if static_parent is not None:
+        static_parent.children.append(node)
+        return node
+    return ui.html(node.render_children(), **_HTML_OPTIONS).classes(node.classes).style(node.style)
+
+
+def badge_group(texts: Sequence[str], variant: str = 'default', gap: str = 'gap-2', font_family: Optional[str] = None, additional_classes: str = ''):
+    """Create a row of shadcn-style badges rendered as a single element
+
+    Args:
+        texts: Badge texts
+        variant: 'default', 'secondary', 'destructive', 'outline', 'success'
+        gap: Gap classes between the badges (default: 'gap-2')
+        font_family: Optional custom font family (overrides global font)
+        additional_classes: Additional Tailwind classes
+
+    Example:
+        badge_group(['python', 'nicegui', 'tailwind'], variant='secondary')
+    """
     font = font_family or FontConfig.get_font()
+    classes = _badge_classes(variant)
 
-    if image_url:
-        # Create avatar with image
-        with ui.element('div').classes(base_classes) as avatar_container:
-            ui.image(image_url).classes('h-full w-full object-cover')
-        return avatar_container
-    else:
-        # Create avatar with fallback text
-        avatar_label = ui.label(fallback_text).classes(f'{base_classes} font-medium {theme["text-secondary"]}')
-        avatar_label.style(f'font-family: {font}')
-        return avatar_label
+    group = _StaticNode('div', f'flex flex-wrap items-center {gap} {additional_classes}'.strip(), f'font-family: {font}')
+    for text in texts:
+        group.add('span', classes, text=text)
+    return _bulk_element(group)
+
+
+def button_group(
+    texts: Sequence[str],
+    on_click: Optional[Callable[[str], Optional[Awaitable]]] = None,
+    variant: str = 'default',
+    size: str = 'default',
+    gap: str = 'gap-2',
+    font_family: Optional[str] = None,
+    additional_classes: str = ''
+):
+    """Create a row of shadcn-style buttons rendered as a single element
+
+    All buttons share one click listener; the browser only sends the index of the clicked button.
+
+    Args:
+        texts: Button texts
+        on_click: Optional (async) callback receiving the text of the clicked button
+        variant: 'default', 'destructive', 'outline', 'ghost', 'secondary'
+        size: 'default', 'sm', 'lg', 'icon'
+        gap: Gap classes between the buttons (default: 'gap-2')
+        font_family: Optional custom font family (overrides global font)
+        additional_classes: Additional Tailwind classes
+
+    Returns:
+        ui.html object
+
+    Example:
+        button_group(['Day', 'Week', 'Month'], on_click=lambda period: load(period), variant='outline')
+    """
+    font = font_family or FontConfig.get_font()
+    classes = _button_classes(variant, size)
+
+    group = _StaticNode('div', f'flex flex-wrap items-center {gap} {additional_classes}'.strip(), f'font-family: {font}')
+    for i, text in enumerate(texts):
+        group.add('button', classes, text=text, attributes={'type': 'button', 'data-index': str(i)})
+    element = ui.html(group.render_children(), **_HTML_OPTIONS).classes(group.classes).style(group.style)
+
+    if on_click is not None:
+        async def handle_click(e):
+            if not isinstance(e.args, int) or not 0 <= e.args < len(texts):
+                return
+            result = on_click(texts[e.args])
+            if inspect.isawaitable(result):
+                await result
+
+        # Event delegation: one listener for all buttons, resolved by the clicked button's data-index
+        element.on('click', handle_click, js_handler='''(event) => {
+            const button = event.target.closest("[data-index]");
+            if (button) emit(Number(button.dataset.index));
+        }''')
+
+    return element
+
+
+def avatar_stack(
+    users: Sequence[Union[str, Dict[str, str]]],
+    max_visible: int = 4,
+    size: str = 'md',
+    font_family: Optional[str] = None,
+    additional_classes: str = ''
+):
+    """Create overlapping shadcn-style avatars rendered as a single element
+
+    Args:
+        users: Fallback texts (usually initials) or dictionaries with 'image_url' and/or 'fallback_text'
+        max_visible: Maximum number of avatars shown; the others are summarized as "+N" (default: 4)
+        size: 'sm', 'md', 'lg', 'xl' (default: 'md')
+        font_family: Optional custom font family (overrides global font)
+        additional_classes: Additional Tailwind classes
+
+    Example:
+        avatar_stack([{'image_url': '/avatars/ana.png'}, 'JD', 'MK', 'TS', 'LP'], max_visible=3)
+    """
+    theme = ThemeConfig.get_theme()
+    font = font_family or FontConfig.get_font()
+    ring_color = theme['bg-primary'].replace('bg-', 'ring-')
+    classes = _avatar_classes(size, 'circle', f'ring-2 {ring_color} font-medium {theme["text-secondary"]}')
+
+    stack = _StaticNode('div', f'flex items-center -space-x-2 {additional_classes}'.strip(), f'font-family: {font}')
+    for user in users[:max_visible]:
+        user = {'fallback_text': user} if isinstance(user, str) else user
+        if user.get('image_url'):
+            avatar_node = stack.add('div', classes)
+            avatar_node.add('img', 'h-full w-full object-cover', attributes={'src': user['image_url'], 'alt': user.get('fallback_text', '')})
+        else:
+            stack.add('div', classes, text=user.get('fallback_text', ''))
+    if len(users) > max_visible:
+        hidden = len(users) - max_visible
+        stack.add('div', classes, text=f'+{hidden}', attributes={'title': f'{hidden} more'})
+    return _bulk_element(stack)
 
 
 def separator(orientation: str = 'horizontal', additional_classes: str = ''):
@@ -556,15 +1967,20 @@ def separator(orientation: str = 'horizontal', additional_classes: str = ''):
     else:
         classes = f'w-full h-px {border_color} {additional_classes}'.strip()
 
+    static_parent = _static_parent()
+    if static_parent is not None:
+        return static_parent.add('hr', f'q-separator q-separator--{orientation} nicegui-separator {classes}', attributes={'aria-orientation': orientation})
+
     return ui.separator().classes(classes)
 
 
-def calendar(on_change=None, value=None, additional_classes: str = ''):
+def calendar(on_change=None, value=None, name: Optional[str] = None, additional_classes: str = ''):
     """Create a shadcn-style date picker/calendar
 
     Args:
         on_change: Callback function when date is selected
         value: Initial date value (string in format 'YYYY-MM-DD' or None)
+        name: Key of the value when used inside a form
         additional_classes: Additional Tailwind classes
 
     Returns:
@@ -578,6 +1994,7 @@ def calendar(on_change=None, value=None, additional_classes: str = ''):
     date_picker = ui.date(value=value, on_change=on_change)
     date_picker.classes(classes)
     date_picker.props('outlined flat')
+    _register_form_field(date_picker, name)
 
     return date_picker
 
@@ -591,7 +2008,12 @@ def barchart(data: Dict[str, int], title: str = '', height: int = 400, label: st
         height: Chart height in pixels
         label: Label for the value in tooltip (default: 'Count')
         additional_classes: Additional Tailwind classes
+
+    Returns:
+        The ui.plotly element
     """
+    import plotly.graph_objects as go
+
     categories = list(data.keys())
     values = list(data.values())
 
@@ -641,7 +2063,7 @@ def barchart(data: Dict[str, int], title: str = '', height: int = 400, label: st
             gridcolor='#f3f4f6',
             showline=False,
             tickfont=dict(size=11, color='#64748b'),
-            range=[0, max(values) * 1.15] if values else [0, 1],
+            range=[0, max(values) * 1.15] if len(values) else [0, 1],
         ),
         hoverlabel=dict(
             bgcolor='#000000',
@@ -655,14 +2077,16 @@ def barchart(data: Dict[str, int], title: str = '', height: int = 400, label: st
 
     # Create chart in a card with shadcn styling
     with ui.card().classes(f'w-full p-6 {additional_classes}'.strip()):
-        ui.plotly(fig).classes('w-full')
+        plot = ui.plotly(fig).classes('w-full')
+
+    return plot
 
 
 def timeseries(dates: List[str], values: List[int], title: str = '', height: int = 400, line_color: str = '#0f172a', smooth: bool = True, label: str = 'Count', additional_classes: str = ''):
     """Create a shadcn-style timeseries chart
 
     Args:
-        dates: List of date strings (e.g., ['2024-01-01', '2024-01-02', ...])
+        dates: List of date strings (e.g., ['2024-01-01', '2024-01-02', ...]), or a NumPy array
         values: List of corresponding values
         title: Chart title
         height: Chart height in pixels
@@ -670,7 +2094,12 @@ def timeseries(dates: List[str], values: List[int], title: str = '', height: int
         smooth: Use smooth curves (True) or straight lines (False)
         label: Label for the value in tooltip (default: 'Count')
         additional_classes: Additional Tailwind classes
+
+    Returns:
+        The ui.plotly element
     """
+    import plotly.graph_objects as go
+
     # Create line chart with shadcn-inspired styling
     fig = go.Figure(data=[
         go.Scatter(
@@ -720,7 +2149,7 @@ def timeseries(dates: List[str], values: List[int], title: str = '', height: int
             linecolor='#e5e7eb',
             tickfont=dict(size=11, color='#64748b'),
             tickangle=-45,
-            range=[-0.5, len(dates) - 0.5] if dates else [0, 1],
+            range=[-0.5, len(dates) - 0.5] if len(dates) else [0, 1],
         ),
         yaxis=dict(
             showgrid=True,
@@ -728,7 +2157,7 @@ def timeseries(dates: List[str], values: List[int], title: str = '', height: int
             gridcolor='#f3f4f6',
             showline=False,
             tickfont=dict(size=11, color='#64748b'),
-            range=[0, max(values) * 1.15] if values else [0, 1],
+            range=[0, max(values) * 1.15] if len(values) else [0, 1],
         ),
         hoverlabel=dict(
             bgcolor='#000000',
@@ -742,17 +2171,761 @@ def timeseries(dates: List[str], values: List[int], title: str = '', height: int
 
     # Create chart in a card with shadcn styling
     with ui.card().classes(f'w-full p-6 {additional_classes}'.strip()):
-        ui.plotly(fig).classes('w-full')
+        plot = ui.plotly(fig).classes('w-full')
+
+    return plot
+
 
+def _chart_layout(title: str, height: int) -> Dict:
+    """Build the shared shadcn plotly layout from the current theme colors."""
+    theme = ThemeConfig.get_theme()
+
+    return dict(
+        title=dict(
+            text=title,
+            font=dict(family='Inter', size=16, color=theme['raw-text-primary'], weight=600),
+            x=0,
+            xanchor='left'
+        ),
+        plot_bgcolor=theme['raw-bg-primary'],
+        paper_bgcolor=theme['raw-bg-primary'],
+        font=dict(family='Inter', size=12, color=theme['raw-text-secondary']),
+        margin=dict(l=40, r=20, t=60, b=60),
+        height=height,
+        xaxis=dict(
+            showgrid=False,
+            showline=True,
+            linewidth=1,
+            linecolor=theme['raw-border'],
+            tickfont=dict(size=11, color=theme['raw-text-secondary']),
+        ),
+        yaxis=dict(
+            showgrid=True,
+            gridwidth=1,
+            gridcolor=theme['raw-grid'],
+            showline=False,
+            tickfont=dict(size=11, color=theme['raw-text-secondary']),
+        ),
+        hoverlabel=dict(
+            bgcolor='#000000',
+            font_size=12,
+            font_family='Inter',
+            font_color='white',
+            bordercolor='#000000',
+            namelength=-1
+        )
+    )
+
+
+def _build_when_ready(
+    provider: Callable[[], Any],
+    cpu_bound: bool,
+    skeleton: Callable[[], None],
+    build: Callable[[Any], ui.element],
+) -> 'asyncio.Task':
+    """Show a skeleton, load the data in the background and replace the skeleton with the built component."""
+    theme = ThemeConfig.get_theme()
+    container = ui.element('div').classes('w-full')
+    with container:
+        skeleton()
+
+    async def load() -> ui.element:
+        try:
+            if inspect.iscoroutinefunction(provider):
+                data = await provider()
+            elif cpu_bound:
+                data = await run.cpu_bound(provider)
+            else:
+                data = await run.io_bound(provider)
+            if inspect.isawaitable(data):  # e.g. a lambda returning a coroutine
+                data = await data
+        except Exception:
+            container.clear()
+            with container:
+                error_label = ui.label('Failed to load data').classes(f'text-sm {theme["text-muted"]}')
+                error_label.style(f'font-family: {FontConfig.get_font()}')
+            raise
+        container.clear()
+        with container:
+            return build(data)
+
+    return background_tasks.create(load(), name='shadcn async component')
+
+
+def _chart_skeleton(height: int, additional_classes: str = ''):
+    """Placeholder with the shape of a chart card."""
+    with ui.card().classes(f'w-full p-6 {additional_classes}'.strip()):
+        _skeleton('w-full').style(f'height: {height}px')
+
+
+def table_async(
+    columns: List[Dict],
+    provider: Callable[[], Union[List[Dict], Awaitable[List[Dict]]]],
+    skeleton_rows: int = 5,
+    cpu_bound: bool = False,
+    additional_classes: str = ''
+) -> 'asyncio.Task':
+    """Create a shadcn-style table whose rows are loaded in the background
+
+    A skeleton with the table's columns is shown right away. The provider runs in a thread
+    (or a process with ``cpu_bound=True``, or is awaited if it is async), then the skeleton is
+    replaced by the table. The page does not wait for the data unless the task is awaited.
+
+    Args:
+        columns: List of column definitions (see ``table``)
+        provider: (Async) callable returning the rows
+        skeleton_rows: Number of placeholder rows (default: 5)
+        cpu_bound: Run the provider in a separate process (it must be picklable)
+        additional_classes: Additional Tailwind classes
+
+    Returns:
+        Task resolving to the ui.table object
+
+    Example:
+        table_async(columns, lambda: db.fetch_orders(limit=100))
+    """
+    theme = ThemeConfig.get_theme()
 
-def accordion(items: List[Dict[str, str]], width: str = 'w-full', variant: str = 'default', font_family: Optional[str] = None, additional_classes: str = ''):
+    def skeleton():
+        with ui.column().classes(f'w-full gap-3 rounded-md border {theme["border-default"]} p-4'):
+            for _ in range(skeleton_rows + 1):
+                with ui.row().classes('w-full gap-4 no-wrap'):
+                    for _ in columns:
+                        _skeleton('h-4 flex-1')
+
+    return _build_when_ready(provider, cpu_bound, skeleton, lambda rows: table(columns, rows, additional_classes=additional_classes))
+
+
+def barchart_async(
+    provider: Callable[[], Union[Dict[str, int], Awaitable[Dict[str, int]]]],
+    title: str = '',
+    height: int = 400,
+    label: str = 'Count',
+    cpu_bound: bool = False,
+    additional_classes: str = ''
+) -> 'asyncio.Task':
+    """Create a shadcn-style bar chart whose data is loaded in the background
+
+    Args:
+        provider: (Async) callable returning the data (see ``barchart``)
+        title: Chart title
+        height: Chart height in pixels
+        label: Label for the value in tooltip (default: 'Count')
+        cpu_bound: Run the provider in a separate process (it must be picklable)
+        additional_classes: Additional Tailwind classes
+
+    Returns:
+        Task resolving to the ui.plotly element
+
+    Example:
+        barchart_async(load_sales_by_region, title='Sales by Region')
+    """
+    return _build_when_ready(
+        provider, cpu_bound,
+        lambda: _chart_skeleton(height, additional_classes),
+        lambda data: barchart(data, title=title, height=height, label=label, additional_classes=additional_classes),
+    )
+
+
+def timeseries_async(
+    provider: Callable[[], Union[Tuple[List[str], List[int]], Awaitable[Tuple[List[str], List[int]]]]],
+    title: str = '',
+    height: int = 400,
+    line_color: str = '#0f172a',
+    smooth: bool = True,
+    label: str = 'Count',
+    cpu_bound: bool = False,
+    additional_classes: str = ''
+) -> 'asyncio.Task':
+    """Create a shadcn-style timeseries chart whose data is loaded in the background
+
+    Args:
+        provider: (Async) callable returning a tuple of dates and values (see ``timeseries``)
+        title: Chart title
+        height: Chart height in pixels
+        line_color: Line color (default: slate-900)
+        smooth: Use smooth curves (True) or straight lines (False)
+        label: Label for the value in tooltip (default: 'Count')
+        cpu_bound: Run the provider in a separate process (it must be picklable)
+        additional_classes: Additional Tailwind classes
+
+    Returns:
+        Task resolving to the ui.plotly element
+
+    Example:
+        timeseries_async(lambda: db.daily_signups(days=90), title='Signups')
+    """
+    return _build_when_ready(
+        provider, cpu_bound,
+        lambda: _chart_skeleton(height, additional_classes),
+        lambda data: timeseries(*data, title=title, height=height, line_color=line_color, smooth=smooth, label=label,
+                                additional_classes=additional_classes),
+    )
+
+
+def histogram(
+    values: Sequence[float],
+    bins: Union[int, Sequence[float]] = 30,
+    range: Optional[Tuple[float, float]] = None,
+    title: str = '',
+    height: int = 400,
+    label: str = 'Count',
+    additional_classes: str = ''
+):
+    """Create a shadcn-style histogram, binned on the server
+
+    Only the bin counts are sent to the browser, so the number of samples does not
+    affect the size of the chart.
+
+    Args:
+        values: Samples to bin (list or NumPy array)
+        bins: Number of bins or a sequence of bin edges (default: 30)
+        range: Optional (min, max) range of the bins (default: data range)
+        title: Chart title
+        height: Chart height in pixels
+        label: Label for the value in tooltip (default: 'Count')
+        additional_classes: Additional Tailwind classes
+
+    Returns:
+        The ui.plotly element
+
+    Example:
+        histogram(np.random.normal(size=10_000_000), bins=50, title='Latency')
+    """
+    import numpy as np
+    import plotly.graph_objects as go
+
+    theme = ThemeConfig.get_theme()
+
+    samples = np.asarray(values, dtype=float).ravel()
+    samples = samples[np.isfinite(samples)]
+    counts, edges = np.histogram(samples, bins=bins, range=range)
+
+    fig = go.Figure(data=[
+        go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            width=np.diff(edges),
+            customdata=np.column_stack([edges[:-1], edges[1:]]),
+            marker=dict(
+                color=theme['raw-accent'],
+                line=dict(color=theme['raw-bg-primary'], width=1)
+            ),
+            hovertemplate=f'<br><b>  %{{customdata[0]:.4g}} – %{{customdata[1]:.4g}}  </b><br>  {label}: %{{y}}  <br><extra></extra>',
+        )
+    ])
+
+    layout = _chart_layout(title, height)
+    layout['bargap'] = 0
+    layout['yaxis']['range'] = [0, counts.max() * 1.15] if counts.size and counts.max() > 0 else [0, 1]
+    fig.update_layout(**layout)
+
+    with ui.card().classes(f'w-full p-6 {additional_classes}'.strip()):
+        plot = ui.plotly(fig).classes('w-full')
+
+    return plot
+
+
+def heatmap(
+    x: Sequence[float],
+    y: Sequence[float],
+    bins: Union[int, Sequence[int]] = 40,
+    range: Optional[Sequence[Tuple[float, float]]] = None,
+    title: str = '',
+    height: int = 400,
+    label: str = 'Count',
+    additional_classes: str = ''
+):
+    """Create a shadcn-style 2D density heatmap, binned on the server
+
+    The samples are aggregated with ``numpy.histogram2d`` and only the grid of counts
+    is sent to the browser.
+
+    Args:
+        x: Sample x coordinates (list or NumPy array)
+        y: Sample y coordinates, same length as x
+        bins: Number of bins, or [x_bins, y_bins] (default: 40)
+        range: Optional [(x_min, x_max), (y_min, y_max)] (default: data range)
+        title: Chart title
+        height: Chart height in pixels
+        label: Label for the value in tooltip (default: 'Count')
+        additional_classes: Additional Tailwind classes
+
+    Returns:
+        The ui.plotly element
+
+    Example:
+        heatmap(df['lon'].to_numpy(), df['lat'].to_numpy(), bins=[60, 40], title='Pickups')
+    """
+    import numpy as np
+    import plotly.graph_objects as go
+
+    theme = ThemeConfig.get_theme()
+
+    x_samples = np.asarray(x, dtype=float).ravel()
+    y_samples = np.asarray(y, dtype=float).ravel()
+    finite = np.isfinite(x_samples) & np.isfinite(y_samples)
+    counts, x_edges, y_edges = np.histogram2d(x_samples[finite], y_samples[finite], bins=bins, range=range)
+
+    fig = go.Figure(data=[
+        go.Heatmap(
+            x=(x_edges[:-1] + x_edges[1:]) / 2,
+            y=(y_edges[:-1] + y_edges[1:]) / 2,
+            z=counts.T,  # histogram2d indexes as [x, y], plotly expects rows of y
+            colorscale=[[0, theme['raw-bg-primary']], [1, theme['raw-accent']]],
+            colorbar=dict(
+                outlinewidth=0,
+                thickness=12,
+                tickfont=dict(size=11, color=theme['raw-text-secondary']),
+            ),
+            hovertemplate=f'<br><b>  %{{x:.4g}}, %{{y:.4g}}  </b><br>  {label}: %{{z}}  <br><extra></extra>',
+        )
+    ])
+
+    layout = _chart_layout(title, height)
+    layout['yaxis']['showgrid'] = False
+    fig.update_layout(**layout)
+
+    with ui.card().classes(f'w-full p-6 {additional_classes}'.strip()):
+        plot = ui.plotly(fig).classes('w-full')
+
+    return plot
+
+
+_sparkline_cache = _LRUCache(maxsize=2048)
+
+
+def _sparkline_svg(values: 'np.ndarray', width: int, height: int, color: str, stroke_width: float, fill: bool) -> str:
+    """Render a sparkline as an SVG string."""
+    import numpy as np
+    padding = stroke_width
+    points = values[np.isfinite(values)]
+
+    svg_open = f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">'
+    if points.size == 0:
+        return f'{svg_open}</svg>'
+
+    # Downsample to at most two points (min and max) per pixel column so peaks survive
+    columns = int(max(width - 2 * padding, 1))
+    if points.size > 2 * columns:
+        starts = np.searchsorted(np.arange(points.size) * columns // points.size, np.arange(columns))
+        points = np.column_stack([np.minimum.reduceat(points, starts), np.maximum.reduceat(points, starts)]).ravel()
+
+    low, high = points.min(), points.max()
+    span = high - low
+    xs = np.linspace(padding, width - padding, points.size) if points.size > 1 else np.array([width / 2])
+    ys = (height - padding) - (points - low) / span * (height - 2 * padding) if span else np.full(points.size, height / 2)
+
+    line = ' L'.join(f'{x:.1f},{y:.1f}' for x, y in zip(xs, ys))
+    area = ''
+    if fill:
+        area = f'<path d="M{xs[0]:.1f},{height} L{line} L{xs[-1]:.1f},{height} Z" fill="{color}" fill-opacity="0.1" stroke="none"/>'
+    path = (f'<path d="M{line}" fill="none" stroke="{color}" stroke-width="{stroke_width}" '
+            'stroke-linejoin="round" stroke-linecap="round"/>')
+
+    return f'{svg_open}{area}{path}</svg>'
+
+
+def sparkline(
+    values: Sequence[float],
+    width: int = 120,
+    height: int = 32,
+    color: Optional[str] = None,
+    stroke_width: float = 1.5,
+    fill: bool = False,
+    additional_classes: str = ''
+):
+    """Create a shadcn-style inline sparkline
+
+    Renders a small SVG path on the server without plotly, so hundreds of sparklines
+    can be shown on a page (e.g. one per table row). Long series are downsampled to
+    the pixel width and the generated SVG is cached.
+
+    Args:
+        values: Series values (list or NumPy array)
+        width: Width in pixels (default: 120)
+        height: Height in pixels (default: 32)
+        color: Line color (default: theme accent color)
+        stroke_width: Line width in pixels (default: 1.5)
+        fill: Fill the area below the line with a subtle tint
+        additional_classes: Additional Tailwind classes
+
+    Returns:
+        The ui.html element containing the SVG
+
+    Example:
+        sparkline([3, 5, 4, 8, 6, 9], width=80, height=24)
+    """
+    import numpy as np
+    line_color = color or ThemeConfig.get_color('raw-accent')
+    series = np.ascontiguousarray(values, dtype=float).ravel()
+
+    # Cache only the SVG, keyed by a digest of the series instead of the series itself
+    key = (hashlib.sha256(series.tobytes()).hexdigest(), series.size, width, height, line_color, stroke_width, fill)
+    svg = _sparkline_cache.get(key)
+    if svg is None:
+        svg = _sparkline_svg(series, width, height, line_color, stroke_width, fill)
+        _sparkline_cache.set(key, svg)
+
+    return ui.html(svg, **_HTML_OPTIONS).classes(f'inline-block leading-none {additional_classes}'.strip())
+
+
+class _CrossfilterIndex:
+    """Sorted index of one crossfilter column, shared by every crossfilter over the same data."""
+
+    def __init__(self, column: 'np.ndarray'):
+        import numpy as np
+        # Codes are ranks into the sorted unique values, so one stable sort by code
+        # serves both category lookups and range lookups.
+        self.categories, self.codes = np.unique(column, return_inverse=True)
+        self.codes = self.codes.ravel()
+        self.order = np.argsort(self.codes, kind='stable')
+        self.offsets = np.searchsorted(self.codes[self.order], np.arange(len(self.categories) + 1))
+
+    def rows_for_codes(self, codes: 'np.ndarray') -> 'np.ndarray':
+        """Return the row indices of the given category codes."""
+        import numpy as np
+        if not codes.size:
+            return np.empty(0, dtype=np.intp)
+        return np.concatenate([self.order[self.offsets[code]:self.offsets[code + 1]] for code in codes])
+
+
+class _CrossfilterData:
+    """Columns of a crossfilter with their indexes and weights, built once on first use and never modified."""
+
+    def __init__(self, columns: Dict[str, Sequence]):
+        import numpy as np
+        self.columns = {name: np.asarray(values) for name, values in columns.items()}
+        lengths = {len(values) for values in self.columns.values()}
+        if len(lengths) > 1:
+            raise ValueError('All crossfilter columns must have the same length')
+        self.size = lengths.pop() if lengths else 0
+        self._indexes: Dict[str, _CrossfilterIndex] = {}
+        self._weights: Dict[str, 'np.ndarray'] = {}
+        self._totals: Dict[Tuple[str, Optional[str]], 'np.ndarray'] = {}
+
+    def index(self, name: str) -> _CrossfilterIndex:
+        if name not in self._indexes:
+            self._indexes[name] = _CrossfilterIndex(self.columns[name])
+        return self._indexes[name]
+
+    def weights(self, name: str) -> 'np.ndarray':
+        if name not in self._weights:
+            self._weights[name] = self.columns[name].astype(float)
+        return self._weights[name]
+
+    def totals(self, dimension: str, value: Optional[str]) -> 'np.ndarray':
+        """Return the unfiltered group-by of a value column (None counts rows) over a dimension."""
+        import numpy as np
+        if (dimension, value) not in self._totals:
+            index = self.index(dimension)
+            weights = self.weights(value) if value else None
+            self._totals[dimension, value] = np.bincount(index.codes, weights=weights, minlength=len(index.categories))
+        return self._totals[dimension, value]
+
+
+class _CrossfilterDimension:
+    """Filter bitmap and selection of one crossfilter column on one client."""
+
+    def __init__(self, name: str, index: _CrossfilterIndex, size: int):
+        import numpy as np
+        self.name = name
+        self.index = index
+        self.passes = np.ones(size, dtype=bool)
+        self.selection: Optional[np.ndarray] = None  # selected category codes, None if unfiltered
+
+
+class _CrossfilterGroup:
+    """Group-by of a value column over one dimension, ignoring that dimension's own filter."""
+
+    def __init__(self, dimension: _CrossfilterDimension, weights: Optional['np.ndarray'], values: 'np.ndarray'):
+        self.dimension = dimension
+        self.weights = weights
+        self.values = values
+        self.plots: List = []
+
+    def bincount(self, rows: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        weights = self.weights[rows] if self.weights is not None else None
+        index = self.dimension.index
+        return np.bincount(index.codes[rows], weights=weights, minlength=len(index.categories))
+
+
+class Crossfilter:
+    """Dataset shared by linked charts and tables.
+
+    Clicking a bar in one bound chart filters every other bound chart and table. Each
+    dimension keeps a sorted index and a filter bitmap, so a selection change only
+    touches the rows whose filter state changed and only re-aggregates those rows in
+    the affected group-bys. Charts whose values did not change are not updated.
+
+    Create one crossfilter per page, since it holds the bound elements of one client.
+    The sorted indexes do not depend on the filters: create the dataset once at module
+    level and pass it to the crossfilter of each page, so all clients share the indexes
+    and each one only holds its filter bitmaps and aggregates.
+
+    Example:
+        sales_data = Crossfilter({'region': regions, 'product': products, 'amount': amounts})
+
+        @ui.page('/')
+        def index():
+            sales = Crossfilter(sales_data)
+            sales.barchart('region', value='amount', title='Revenue by region')
+            sales.barchart('product', title='Orders by product')
+            sales.table(columns, limit=50)
+    """
+
+    def __init__(self, columns: Union[Dict[str, Sequence], 'Crossfilter']):
+        """Create a crossfilter over equally long columns.
+
+        Args:
+            columns: Mapping of column names to sequences or NumPy arrays, or another
+                     crossfilter whose data and indexes to share
+        """
+        import numpy as np
+        self._data = columns._data if isinstance(columns, Crossfilter) else _CrossfilterData(columns)
+        self._size = self._data.size
+
+        self._dimensions: Dict[str, _CrossfilterDimension] = {}
+        self._groups: List[_CrossfilterGroup] = []
+        self._tables: List[Tuple] = []
+        self._fail_count = np.zeros(self._size, dtype=np.int32)  # number of dimensions rejecting each row
+
+    def _dimension(self, name: str) -> _CrossfilterDimension:
+        if name not in self._dimensions:
+            self._dimensions[name] = _CrossfilterDimension(name, self._data.index(name), self._size)
+        return self._dimensions[name]
+
+    def _group(self, dimension: str, value: Optional[str]) -> _CrossfilterGroup:
+        import numpy as np
+        dim = self._dimension(dimension)
+        weights = self._data.weights(value) if value else None
+        group = _CrossfilterGroup(dim, weights, np.zeros(len(dim.index.categories)))
+        if all(other.selection is None for other in self._dimensions.values()):
+            group.values = self._data.totals(dimension, value)  # shared, _apply replaces it instead of adding in place
+        else:
+            group.values = group.bincount(np.flatnonzero(self._fail_count - ~dim.passes == 0))
+        self._groups.append(group)
+        return group
+
+    @property
+    def selected_rows(self) -> 'np.ndarray':
+        """Indices of the rows passing all filters."""
+        import numpy as np
+        return np.flatnonzero(self._fail_count == 0)
+
+    def filter(self, dimension: str, values: Optional[Sequence] = None):
+        """Keep only rows whose dimension value is in ``values`` (None clears the filter).
+
+        Args:
+            dimension: Column name
+            values: Values to keep, or None to clear the filter
+        """
+        import numpy as np
+        dim = self._dimension(dimension)
+        if values is None:
+            self._apply(dim, np.ones(self._size, dtype=bool), None)
+            return
+        index = dim.index
+        wanted = np.asarray(values)
+        codes = np.searchsorted(index.categories, wanted)
+        found = codes < len(index.categories)
+        found[found] = index.categories[codes[found]] == wanted[found]
+        codes = np.unique(codes[found])
+        passes = np.zeros(self._size, dtype=bool)
+        passes[index.rows_for_codes(codes)] = True
+        self._apply(dim, passes, codes)
+
+    def filter_range(self, dimension: str, low, high):
+        """Keep only rows with ``low <= value < high``.
+
+        Args:
+            dimension: Column name
+            low: Inclusive lower bound
+            high: Exclusive upper bound
+        """
+        import numpy as np
+        dim = self._dimension(dimension)
+        index = dim.index
+        start, end = np.searchsorted(index.categories, [low, high])
+        passes = np.zeros(self._size, dtype=bool)
+        passes[index.order[index.offsets[start]:index.offsets[end]]] = True
+        self._apply(dim, passes, np.arange(start, end))
+
+    def toggle(self, dimension: str, value):
+        """Add a value to or remove it from the dimension's selection.
+
+        Args:
+            dimension: Column name
+            value: Category to toggle
+        """
+        dim = self._dimension(dimension)
+        selected = set() if dim.selection is None else {dim.index.categories[code] for code in dim.selection}
+        selected ^= {value}
+        self.filter(dimension, sorted(selected) if selected else None)
+
+    def _apply(self, dim: _CrossfilterDimension, passes: 'np.ndarray', selection: Optional['np.ndarray']):
+        import numpy as np
+        changed = np.flatnonzero(dim.passes != passes)
+        dim.passes = passes
+        dim.selection = selection
+
+        dirty = {id(group) for group in self._groups if group.dimension is dim}  # selection highlight changed
+        if changed.size:
+            old_fail = self._fail_count[changed]
+            new_fail = old_fail + np.where(passes[changed], -1, 1)  # every changed row flipped its bit
+            self._fail_count[changed] = new_fail
+            for group in self._groups:
+                if group.dimension is dim:
+                    continue
+                own_fail = ~group.dimension.passes[changed]
+                before = old_fail - own_fail == 0
+                after = new_fail - own_fail == 0
+                delta = group.bincount(changed[after & ~before]) - group.bincount(changed[before & ~after])
+                if delta.any():
+                    group.values = group.values + delta
+                    dirty.add(id(group))
+            for table_element, limit in self._tables:
+                table_element.rows = self._rows(limit)
+                table_element.update()
+
+        for group in self._groups:
+            if id(group) in dirty:
+                self._update_plots(group)
+
+    def _update_plots(self, group: _CrossfilterGroup):
+        import numpy as np
+        theme = ThemeConfig.get_theme()
+        dim = group.dimension
+        if dim.selection is None:
+            colors = theme['raw-accent']
+        else:
+            selected = np.zeros(len(dim.index.categories), dtype=bool)
+            selected[dim.selection] = True
+            colors = np.where(selected, theme['raw-accent'], theme['raw-border']).tolist()
+        values = group.values.tolist()
+        for plot in group.plots:
+            trace = plot.figure.data[0]
+            trace.y = values
+            trace.text = values
+            trace.marker.color = colors
+            plot.figure.layout.yaxis.range = [0, max(values) * 1.15] if values and max(values) > 0 else [0, 1]
+            plot.update()
+
+    def _rows(self, limit: Optional[int]) -> List[Dict]:
+        rows = self.selected_rows[:limit]
+        columns = {name: values[rows].tolist() for name, values in self._data.columns.items()}
+        return [{'id': int(row), **{name: columns[name][i] for name in columns}} for i, row in enumerate(rows)]
+
+    def barchart(self, dimension: str, value: Optional[str] = None, title: str = '', height: int = 400, label: str = '', additional_classes: str = ''):
+        """Create a shadcn-style bar chart bound to this crossfilter.
+
+        Clicking a bar toggles that category in the dimension's filter.
+
+        Args:
+            dimension: Column to group by
+            value: Column to sum (default: count rows)
+            title: Chart title
+            height: Chart height in pixels
+            label: Label for the value in tooltip (default: value column name or 'Count')
+            additional_classes: Additional Tailwind classes
+
+        Returns:
+            The ui.plotly element
+        """
+        group = self._group(dimension, value)
+        categories = group.dimension.index.categories
+        data = dict(zip([str(category) for category in categories], group.values.tolist()))
+        plot = barchart(data, title=title, height=height, label=label or value or 'Count', additional_classes=additional_classes)
+        group.plots.append(plot)
+
+        lookup = {str(category): category for category in categories}
+        plot.on('plotly_click', lambda e: self.toggle(dimension, lookup[str(e.args['points'][0]['x'])]))
+
+        return plot
+
+    def table(self, columns: List[Dict], limit: Optional[int] = 100, additional_classes: str = ''):
+        """Create a shadcn-style table showing the rows that pass all filters.
+
+        Args:
+            columns: List of column definitions (see ``table``)
+            limit: Maximum number of rows to show (default: 100, None for all)
+            additional_classes: Additional Tailwind classes
+
+        Returns:
+            The ui.table element
+        """
+        table_element = table(columns, self._rows(limit), additional_classes=additional_classes)
+        self._tables.append((table_element, limit))
+        return table_element
+
+
+def _accordion_content(content: Union[str, Callable[[], None]], font: str):
+    """Build the body of one accordion item from a string or a builder callable."""
+    theme = ThemeConfig.get_theme()
+
+    with ui.column().classes('pb-4 pt-0'):
+        if callable(content):
+            content()
+        else:
+            content_label = ui.label(content).classes(f'text-sm {theme["text-secondary"]}')
+            content_label.style(f'font-family: {font}')
+
+
+class _SearchIndex:
+    """Trigram index over a list of texts for substring search as the user types."""
+
+    def __init__(self, texts: List[str]):
+        self._texts = [text.casefold() for text in texts]
+        self._trigrams: Dict[str, set] = {}
+        for index, text in enumerate(self._texts):
+            for i in range(len(text) - 2):
+                self._trigrams.setdefault(text[i:i + 3], set()).add(index)
+
+    def search(self, query: str) -> set:
+        """Return the indices of the texts containing every whitespace-separated term of the query."""
+        terms = query.casefold().split()
+        candidates = set(range(len(self._texts)))
+        for term in sorted(terms, key=len, reverse=True):
+            if len(term) < 3:
+                continue  # too short for a trigram, checked against the candidates below
+            postings = sorted((self._trigrams.get(term[i:i + 3], set()) for i in range(len(term) - 2)), key=len)
+            candidates = candidates.intersection(*postings)
+            if not candidates:
+                return candidates
+        return {index for index in candidates if all(term in self._texts[index] for term in terms)}
+
+
+def accordion(
+    items: List[Dict[str, Union[str, Callable[[], None]]]],
+    width: str = 'w-full',
+    variant: str = 'default',
+    lazy: bool = False,
+    searchable: bool = False,
+    search_placeholder: str = 'Search...',
+    debounce_ms: int = 300,
+    client_side: bool = False,
+    on_sync: Optional[Callable[[Dict[int, bool]], None]] = None,
+    sync_interval: float = 1.0,
+    font_family: Optional[str] = None,
+    additional_classes: str = ''
+):
     """Create a shadcn-style accordion component with multiple expandable items.
 
     Args:
         items: List of accordion items, each with 'title' and 'content' keys
                Example: [{'title': 'Item 1', 'content': 'Content 1'}, ...]
+               'content' may also be a callable that builds the item body; it runs on the first expand
         width: Width classes (default: 'w-full')
         variant: 'default', 'bordered', 'separated' (default: 'default')
+        lazy: Build string content on the first expand too, so collapsed items only cost their header
+        searchable: Show a search box that filters items by title and (string) content
+        search_placeholder: Placeholder of the search box (default: 'Search...')
+        debounce_ms: Delay after the last keystroke before searching (default: 300)
+        client_side: Keep the open/closed state of the items in the browser only
+        on_sync: Optional callback receiving {item index: open} of a client-side accordion,
+                 batched for all items and sent at most once per ``sync_interval``
+        sync_interval: Minimum seconds between two ``on_sync`` calls (default: 1.0)
         font_family: Optional custom font family (overrides global font)
         additional_classes: Additional Tailwind classes
 
@@ -763,6 +2936,7 @@ def accordion(items: List[Dict[str, str]], width: str = 'w-full', variant: str =
         accordion([
             {'title': 'Is it accessible?', 'content': 'Yes. It adheres to the WAI-ARIA design pattern.'},
             {'title': 'Is it styled?', 'content': 'Yes. It comes with default styles.'},
+            {'title': 'Show me a chart', 'content': lambda: barchart({'A': 1, 'B': 2})},
         ])
     """
     theme = ThemeConfig.get_theme()
@@ -775,23 +2949,406 @@ def accordion(items: List[Dict[str, str]], width: str = 'w-full', variant: str =
         'separated': f'w-full mb-4 border {theme["border-default"]} rounded-lg shadow-sm',
     }
 
+    def build_body(exp, content):
+        if not exp.default_slot.children:
+            with exp:
+                _accordion_content(content, font)
+
+    def build_on_first_expand(e, content):
+        if e.value:
+            build_body(e.sender, content)
+
     with ui.column().classes(f'{width} {additional_classes}'.strip()) as container:
-        for item in items:
+        if searchable:
+            # Styled like input(), but never registered as a field of an enclosing form
+            search_field = ui.input(placeholder=search_placeholder)
+            search_field.classes(f'w-full {theme["input-bg"]} {theme["text-primary"]}')
+            search_field.props('outlined dense borderless clearable')
+            search_field.style(f'font-family: {font}')
+            if debounce_ms:
+                search_field.props(f'debounce={debounce_ms}')
+
+        expansions = []
+        for i, item in enumerate(items):
             title = item.get('title', '')
             content = item.get('content', '')
 
             item_classes = variant_classes.get(variant, variant_classes['default'])
 
-            with ui.expansion(title, icon='').classes(item_classes) as exp:
+            if client_side:
+                exp = ui.element('q-expansion-item').classes(f'nicegui-expansion {item_classes}')
+                exp._props['label'] = title
+            else:
+                exp = ui.expansion(title, icon='').classes(item_classes)
+
+            with exp:
                 # Style the expansion header
                 exp._props['header-class'] = f'text-sm font-medium hover:no-underline {theme["text-primary"]}'
 
-                # Add content
-                with ui.column().classes('pb-4 pt-0'):
-                    content_label = ui.label(content).classes(f'text-sm {theme["text-secondary"]}')
-                    content_label.style(f'font-family: {font}')
+                # Add content now, or on the first expand for lazy items
+                if not (lazy or callable(content)):
+                    _accordion_content(content, font)
+                elif client_side:
+                    exp.on('show.once', lambda e, content=content: build_body(e.sender, content))
+                else:
+                    exp.on_value_change(lambda e, content=content: build_on_first_expand(e, content))
+
+                # Collect the state of all items in the browser and report it as one batched event
+                if client_side and on_sync:
+                    exp.on('update:model-value', js_handler=f'''(value) => {{
+                        const container = document.getElementById("c{container.id}");
+                        container.shadcnState = {{...container.shadcnState, {i}: value}};
+                        container.dispatchEvent(new CustomEvent("shadcn-sync", {{detail: container.shadcnState}}));
+                    }}''')
 
                 # Apply font to expansion header
                 exp.style(f'font-family: {font}')
+            expansions.append(exp)
+
+        if searchable:
+            empty_label = ui.label('No results found.').classes(f'text-sm {theme["text-muted"]} py-4')
+            empty_label.style(f'font-family: {font}')
+            empty_label.set_visibility(False)
+
+            # Builder callables have no text to index, so those items match on their title only
+            index = _SearchIndex([
+                item.get('title', '') + '\n' + (item.get('content', '') if not callable(item.get('content')) else '')
+                for item in items
+            ])
+
+            def filter_items(e):
+                # Only items whose visibility actually changes are sent to the browser
+                matches = index.search(e.value or '')
+                for i, exp in enumerate(expansions):
+                    exp.set_visibility(i in matches)
+                empty_label.set_visibility(not matches)
+
+            search_field.on_value_change(filter_items)
+
+    if client_side and on_sync:
+        container.on('shadcn-sync', lambda e: on_sync({int(key): value for key, value in e.args['detail'].items()}),
+                     ['detail'], throttle=sync_interval, leading_events=False)
 
     return container
+
+
+class KeyedList(ui.column):
+    """Column rendering one element per item, reconciled by key when the items change.
+
+    Elements of items that are still present are kept (and moved if the order changed),
+    changed items are updated in place or re-rendered, and only the elements of added
+    or removed items are created or deleted.
+    """
+
+    def __init__(
+        self,
+        key: Callable[[Any], Any],
+        render: Callable[[Any], ui.element],
+        update: Optional[Callable[[ui.element, Any], None]] = None,
+    ):
+        """Create an empty keyed list.
+
+        Args:
+            key: Function returning the unique key of an item
+            render: Function creating the elements of an item
+            update: Optional function updating the element returned by ``render`` for a
+                    changed item in place; without it, changed items are rendered again
+        """
+        super().__init__()
+        self._key = key
+        self._render = render
+        self._update = update
+        self._items: Dict[Any, Any] = {}  # snapshots, so items mutated by the caller are detected as changed
+        self._elements: Dict[Any, ui.element] = {}  # return values of render
+        self._children: Dict[Any, List[ui.element]] = {}  # elements render added to this list
+
+    def _remove_item(self, item_key):
+        for child in self._children.pop(item_key):
+            self.remove(child)
+        del self._elements[item_key]
+        del self._items[item_key]
+
+    def set_items(self, items: Sequence):
+        """Show the given items, reusing the elements of unchanged keys.
+
+        Args:
+            items: New list of items
+        """
+        keyed = {}
+        for item in items:
+            item_key = self._key(item)
+            if item_key in keyed:
+                raise ValueError(f'Duplicate key {item_key!r} in keyed list')
+            keyed[item_key] = item
+
+        for item_key in [k for k in self._elements if k not in keyed]:
+            self._remove_item(item_key)
+
+        for item_key, item in keyed.items():
+            if item_key in self._elements:
+                if self._items[item_key] == item:
+                    continue
+                if self._update is not None:
+                    self._update(self._elements[item_key], item)
+                    self._items[item_key] = copy.deepcopy(item)
+                    continue
+                self._remove_item(item_key)
+            existing = len(self.default_slot.children)
+            with self:
+                self._elements[item_key] = self._render(item)
+            # Use the top-level elements render created, e.g. input() returns the field inside its column
+            self._children[item_key] = self.default_slot.children[existing:]
+            self._items[item_key] = copy.deepcopy(item)
+
+        ordered = [child for item_key in keyed for child in self._children[item_key]]
+        if self.default_slot.children != ordered:
+            self.default_slot.children[:] = ordered  # move all elements with a single update
+            self.update()
+
+
+def for_each(
+    items: Sequence,
+    key: Callable[[Any], Any],
+    render: Callable[[Any], ui.element],
+    update: Optional[Callable[[ui.element, Any], None]] = None,
+    additional_classes: str = ''
+):
+    """Render a list of items that can be updated without rebuilding unchanged elements
+
+    Call ``set_items`` on the returned list with new items: elements are matched to items
+    by key, so only added, removed or changed items cause element updates.
+
+    Args:
+        items: Initial items
+        key: Function returning the unique key of an item
+        render: Function creating the elements of an item, e.g. a card
+        update: Optional function updating the element returned by ``render`` for a changed item in place
+        additional_classes: Additional Tailwind classes
+
+    Returns:
+        KeyedList object
+
+    Example:
+        tasks = for_each(
+            load_tasks(),
+            key=lambda task: task['id'],
+            render=lambda task: badge(task['title'], variant=task['status']),
+            update=lambda element, task: element.set_text(task['title']),
+        )
+        tasks.set_items(load_tasks())
+    """
+    keyed_list = KeyedList(key, render, update).classes(f'w-full gap-2 {additional_classes}'.strip())
+    keyed_list.set_items(items)
+    return keyed_list
+
+
+def virtual_accordion(
+    items: List[Dict[str, str]],
+    height: str = 'h-96',
+    width: str = 'w-full',
+    variant: str = 'default',
+    item_size: int = 49,
+    font_family: Optional[str] = None,
+    additional_classes: str = ''
+):
+    """Create a shadcn-style accordion for thousands of items.
+
+    Based on Quasar's QVirtualScroll: only the items inside the viewport are rendered
+    in the browser, and no NiceGUI element is created per item. The expanded state of
+    each item is kept server-side in its item dictionary ('open' key), so it survives
+    scrolling items out of view and back.
+
+    Args:
+        items: List of accordion items, each with 'title' and 'content' keys and an optional unique 'key'
+        height: Height classes of the scroll area (default: 'h-96')
+        width: Width classes (default: 'w-full')
+        variant: 'default', 'bordered', 'separated' (default: 'default')
+        item_size: Estimated height of a collapsed item in pixels (default: 49)
+        font_family: Optional custom font family (overrides global font)
+        additional_classes: Additional Tailwind classes
+
+    Returns:
+        The q-virtual-scroll element; its 'items' prop holds the per-item state
+
+    Example:
+        virtual_accordion([{'title': f'Question {i}', 'content': answers[i]} for i in range(5000)])
+    """
+    theme = ThemeConfig.get_theme()
+    font = font_family or FontConfig.get_font()
+
+    variant_classes = {
+        'default': f'w-full border-b {theme["border-default"]}',
+        'bordered': f'w-full border {theme["border-default"]} rounded-lg mb-2',
+        'separated': f'w-full mb-4 border {theme["border-default"]} rounded-lg shadow-sm',
+    }
+    item_classes = variant_classes.get(variant, variant_classes['default'])
+    header_classes = f'text-sm font-medium hover:no-underline {theme["text-primary"]}'
+
+    state = [
+        {
+            'key': item.get('key', index),
+            'title': item.get('title', ''),
+            'content': item.get('content', ''),
+            'open': bool(item.get('open', False)),
+        }
+        for index, item in enumerate(items)
+    ]
+    by_key = {item['key']: item for item in state}
+
+    scroll = ui.element('q-virtual-scroll').classes(f'{width} {height} {additional_classes}'.strip())
+    scroll._props['items'] = state
+    scroll._props['virtual-scroll-item-size'] = item_size
+    scroll.add_slot('default', f'''
+        <q-expansion-item
+            :key="props.item.key"
+            :label="props.item.title"
+            :model-value="props.item.open"
+            @update:model-value="value => {{
+                props.item.open = value;
+                $parent.$emit('toggle', {{key: props.item.key, open: value}});
+            }}"
+            class="{item_classes}"
+            header-class="{header_classes}"
+            style="font-family: {html.escape(font)}"
+        >
+            <div class="pb-4 pt-0 text-sm {theme["text-secondary"]}">{{{{ props.item.content }}}}</div>
+        </q-expansion-item>
+    ''')
+
+    def handle_toggle(e):
+        # The browser already updated its copy of the item, so no update is sent back
+        item = by_key.get(e.args['key'])
+        if item is not None:
+            item['open'] = e.args['open']
+
+    scroll.on('toggle', handle_toggle)
+
+    return scroll
+
+
+class _LiveSource:
+    """Data source refreshed by the shared scheduler and pushed to its subscribed elements."""
+
+    def __init__(self, name: str, fetch: Callable[[], Any], interval: float):
+        self.name = name
+        self.fetch = fetch
+        self.interval = interval
+        self.subscribers: List[Tuple[ui.element, Callable[[ui.element, Any], None]]] = []
+        self.next_run = 0.0
+        self.running = False
+        self.data: Any = None
+        self.has_data = False
+
+    async def refresh(self):
+        try:
+            if inspect.iscoroutinefunction(self.fetch):
+                data = await self.fetch()
+            else:
+                data = await run.io_bound(self.fetch)
+            if inspect.isawaitable(data):  # e.g. a lambda returning a coroutine
+                data = await data
+            self.data = data
+            self.has_data = True
+            for element, apply in list(self.subscribers):
+                if element.is_deleted:
+                    continue
+                try:
+                    apply(element, self.data)
+                except Exception:  # one failing subscriber must not stop the others
+                    log.exception('Failed to update %r from live source %r', element, self.name)
+        finally:
+            self.running = False
+
+
+_live_sources: Dict[str, _LiveSource] = {}
+_live_scheduler: Dict[str, Optional['asyncio.Task']] = {'task': None}
+_LIVE_TICK = 0.25  # seconds between two scheduler checks
+
+
+async def _run_live_scheduler():
+    """Single loop per process refreshing every due source with subscribers once."""
+    while True:
+        now = time.monotonic()
+        for source in list(_live_sources.values()):
+            source.subscribers = [(element, apply) for element, apply in source.subscribers if not element.is_deleted]
+            if not source.subscribers or source.running or now < source.next_run:
+                continue
+            source.next_run = now + source.interval
+            source.running = True
+            background_tasks.create(source.refresh(), name=f'shadcn live source {source.name}')
+        await asyncio.sleep(_LIVE_TICK)
+
+
+def _apply_live_data(element: ui.element, data: Any):
+    """Show new data in a chart, table, card or label."""
+    if isinstance(element, ui.plotly):
+        # Bar chart data is a dictionary, timeseries data a tuple of dates and values
+        if isinstance(data, dict):
+            x, y = list(data.keys()), list(data.values())
+        else:
+            x, y = list(data[0]), list(data[1])
+            element.figure.layout.xaxis.range = [-0.5, len(x) - 0.5] if x else [0, 1]
+        trace = element.figure.data[0]
+        trace.x = x
+        trace.y = y
+        trace.text = y
+        element.figure.layout.yaxis.range = [0, max(y) * 1.15] if y and max(y) > 0 else [0, 1]
+        element.update()
+    elif isinstance(element, ui.table):
+        element.rows = list(data)
+        element.update()
+    elif isinstance(element, Card):
+        element.card_content = str(data)
+    else:
+        element.set_text(str(data))
+
+
+def register_live_source(name: str, fetch: Callable[[], Any], interval: float = 5.0):
+    """Register a data source refreshed by the shared dashboard scheduler.
+
+    All live elements share one scheduler loop per process. Each source is fetched once per
+    interval, independent of the number of clients, and only while elements are subscribed.
+
+    Args:
+        name: Unique name of the source
+        fetch: (Async) callable returning the current data; sync callables run in a thread
+        interval: Seconds between two refreshes (default: 5.0)
+
+    Example:
+        register_live_source('sales', load_sales_by_region, interval=10)
+    """
+    if name in _live_sources:
+        raise ValueError(f'Live source {name!r} is already registered')
+    _live_sources[name] = _LiveSource(name, fetch, interval)
+
+
+def live_update(element: ui.element, source: str, apply: Optional[Callable[[ui.element, Any], None]] = None):
+    """Update an element whenever a live source is refreshed.
+
+    Without ``apply``, bar charts receive a dictionary, timeseries charts a tuple of dates and
+    values, tables a list of rows, and cards or labels (badges, headings) a value shown as text.
+    Subscriptions of deleted elements, e.g. of disconnected clients, are removed automatically.
+
+    Args:
+        element: Element to update
+        source: Name of a source registered with ``register_live_source``
+        apply: Optional callable receiving the element and the new data
+
+    Returns:
+        The element
+
+    Example:
+        live_update(barchart({}, title='Sales by Region'), 'sales')
+        live_update(card(title='Open orders', card_content='-'), 'open_orders')
+    """
+    live_source = _live_sources.get(source)
+    if live_source is None:
+        raise ValueError(f'Unknown live source {source!r}, register it with register_live_source() first')
+    apply = apply or _apply_live_data
+    live_source.subscribers.append((element, apply))
+    if live_source.has_data:
+        apply(element, live_source.data)
+
+    if _live_scheduler['task'] is None or _live_scheduler['task'].done():
+        _live_scheduler['task'] = background_tasks.create(_run_live_scheduler(), name='shadcn live scheduler')
+    return element